@@ -0,0 +1,18 @@
+# Helpers for importing the practical modules from their script directories
+
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TYPES_DIR = os.path.join(ROOT, "Types")
+FULL_CODES_DIR = os.path.join(ROOT, "Full Codes")
+
+
+def load(name):
+    """Import a module from Types/ or Full Codes/ by its file name, e.g. "List" or "Code2"."""
+    # The practicals import their siblings by bare name, so both folders go on the path
+    for directory in (TYPES_DIR, FULL_CODES_DIR):
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    return importlib.import_module(name)
@@ -0,0 +1,111 @@
+# Memory and Allocation Benchmark for every node-based structure
+#
+# Run from any directory:  python Memory.py --max-exponent 6
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from Loader import load
+
+
+def _fill(factory, method):
+    """Return a builder that calls method(structure, key) for every key."""
+    def build(keys):
+        structure = factory()
+        insert = getattr(structure, method)
+        for key in keys:
+            insert(key)
+        return structure
+    return build
+
+
+def _fill_map(factory, method):
+    """Return a builder for key/value structures, storing None as every value."""
+    def build(keys):
+        structure = factory()
+        insert = getattr(structure, method)
+        for key in keys:
+            insert(key, None)
+        return structure
+    return build
+
+
+def _fill_person(factory):
+    """Return a builder for person tables, using each key as an age."""
+    def build(keys):
+        table = factory()
+        for key in keys:
+            table.append("", key, "")
+        return table
+    return build
+
+
+def structures():
+    """Return the name and builder of every structure under test."""
+    List, Trees, Pointers = load("List"), load("Trees"), load("Pointers")
+    Code1, Code2 = load("Code1"), load("Code2")
+
+    return {
+        "list (baseline)": list,
+        "List.LinkedList": _fill(List.LinkedList, "insert_at_end"),
+        "List.DoublyLinkedList": _fill(List.DoublyLinkedList, "insert_at_end"),
+        "List.UnrolledLinkedList": _fill(List.UnrolledLinkedList, "insert_at_end"),
+        "List.SkipList": _fill(List.SkipList, "insert"),
+        "Trees.BinaryTree": _fill(Trees.BinaryTree, "insert"),
+        "Pointers.ArenaLinkedList": _fill(lambda: Pointers.ArenaLinkedList("q"), "insert_at_end"),
+        "Pointers.ArenaBST": _fill(lambda: Pointers.ArenaBST("q"), "insert"),
+        "Code1.BST": _fill_map(Code1.BST, "insert"),
+        "Code1.LinkedList": _fill(Code1.LinkedList, "insert"),
+        "Code1.Person": lambda keys: [Code1.Person("", key, "") for key in keys],
+        "Code2.DynamicArray": _fill(Code2.DynamicArray, "append"),
+        "Code2.BinarySearchTree": _fill_map(Code2.BinarySearchTree, "insert"),
+        "Code2.LinkedList": _fill(Code2.LinkedList, "insert_front"),
+        "Code2.IndexedLinkedList": _fill(Code2.IndexedLinkedList, "insert_back"),
+        "Code2.Person": lambda keys: [Code2.Person("", key, "") for key in keys],
+        "Code2.PersonTable": _fill_person(Code2.PersonTable),
+    }
+
+
+def measure(build, size):
+    """Build one structure and return (bytes per element, peak bytes, seconds)."""
+    keys = random.sample(range(size * 4), size)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    structure = build(keys)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current / size, peak, elapsed
+
+
+def run(sizes, only=None):
+    """Measure every selected structure at every size and print a table."""
+    results = []
+    print(f"{'structure':<26} {'n':>10} {'bytes/elem':>11} {'peak MiB':>9} {'build s':>9}")
+    for name, build in structures().items():
+        if only and only not in name:
+            continue
+        for size in sizes:
+            per_element, peak, elapsed = measure(build, size)
+            results.append({"structure": name, "size": size, "bytes_per_element": per_element,
+                            "peak_bytes": peak, "build_seconds": elapsed})
+            print(f"{name:<26} {size:>10} {per_element:>11.1f} {peak / 2**20:>9.1f} {elapsed:>9.3f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report bytes per element and build time.")
+    parser.add_argument("--min-exponent", type=int, default=4, help="smallest size is 10**N")
+    parser.add_argument("--max-exponent", type=int, default=5, help="largest size is 10**N (up to 7)")
+    parser.add_argument("--only", help="only run structures whose name contains this text")
+    args = parser.parse_args()
+    run([10 ** e for e in range(args.min_exponent, args.max_exponent + 1)], args.only)
+
+
+if __name__ == "__main__":
+    main()
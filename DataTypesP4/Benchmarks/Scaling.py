@@ -0,0 +1,254 @@
+# Scaling Benchmark: throughput, peak memory and empirical big-O per structure
+#
+# Run from any directory:
+#   python Scaling.py --max-exponent 6 --output results.json
+#   python Scaling.py --baseline results.json --threshold 0.25
+#
+# Exits with status 1 when a result regresses past the threshold, so the
+# same command can guard a CI job.
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from Loader import load
+
+
+def _array(Array):
+    def run(keys):
+        array = Array(len(keys))
+        for index, key in enumerate(keys):
+            array.insert(index, key)
+        for index in range(len(keys)):
+            array.access(index)
+        return 2 * len(keys)
+    return run
+
+
+def _dynamic_array(DynamicArray):
+    def run(keys):
+        array = DynamicArray()
+        for key in keys:
+            array.append(key)
+        for index in range(len(keys)):
+            array[index]
+        return 2 * len(keys)
+    return run
+
+
+def _linked_list(factory, method):
+    def run(keys):
+        linked_list = factory()
+        insert = getattr(linked_list, method)
+        for key in keys:
+            insert(key)
+        for _ in linked_list:
+            pass
+        return 2 * len(keys)
+    return run
+
+
+def _tree(factory, with_value):
+    def run(keys):
+        tree = factory()
+        for key in keys:
+            if with_value:
+                tree.insert(key, None)
+            else:
+                tree.insert(key)
+        for key in keys:
+            tree.search(key)
+        return 2 * len(keys)
+    return run
+
+
+def _union_operations(UnionOperations):
+    def run(keys):
+        half = len(keys) // 2
+        operations = UnionOperations(set(keys[:half]), set(keys[half // 2:]))
+        operations.union()
+        operations.intersection()
+        operations.difference()
+        for key in keys:
+            operations.is_member(key)
+        return 3 + len(keys)
+    return run
+
+
+def _union_set(UnionSet):
+    def run(keys):
+        half = len(keys) // 2
+        a, b = UnionSet(keys[:half]), UnionSet(keys[half // 2:])
+        a.union(b)
+        a.intersection(b)
+        a.difference(b)
+        for key in keys:
+            key in a
+        return 3 + len(keys)
+    return run
+
+
+def _vector(Vector):
+    def run(keys):
+        total, step = Vector(0.0, 0.0), Vector(1.0, 2.0)
+        for _ in keys:
+            total = total + step * 2.0
+        return 2 * len(keys)
+    return run
+
+
+def _vector_array(VectorArray, Vector):
+    def run(keys):
+        points = VectorArray(keys, keys)
+        (points * 2.0 + Vector(1.0, 2.0)).sum()
+        return 2 * len(keys)
+    return run
+
+
+def workloads():
+    """Return the name and workload of every structure under test.
+
+    A workload performs a batch of operations on len(keys) items and returns
+    how many operations it ran.
+    """
+    Array, Trees, List, Expressions = load("Array"), load("Trees"), load("List"), load("Expressions")
+    Code1, Code2 = load("Code1"), load("Code2")
+
+    return {
+        "Array.Array": _array(Array.Array),
+        "Code1.Array": _array(Code1.Array),
+        "Code2.DynamicArray": _dynamic_array(Code2.DynamicArray),
+        "List.LinkedList": _linked_list(List.LinkedList, "insert_at_end"),
+        "Code1.LinkedList": _linked_list(Code1.LinkedList, "insert"),
+        "Code2.LinkedList": _linked_list(Code2.LinkedList, "insert_front"),
+        "Trees.BinaryTree": _tree(Trees.BinaryTree, with_value=False),
+        "Code1.BST": _tree(Code1.BST, with_value=True),
+        "Code2.BinarySearchTree": _tree(Code2.BinarySearchTree, with_value=True),
+        "Code1.UnionOperations": _union_operations(Code1.UnionOperations),
+        "Code2.UnionSet": _union_set(Code2.UnionSet),
+        "Expressions.Vector": _vector(Expressions.Vector),
+        "Expressions.VectorArray": _vector_array(Expressions.VectorArray, Expressions.Vector),
+    }
+
+
+def measure(run, size, seed, repeat=3):
+    """Run one workload and return (ops/sec, best seconds, peak bytes).
+
+    The timed passes run without tracemalloc, whose hooks would distort them,
+    and the fastest of repeat passes is kept to damp scheduler noise; a final
+    pass only records peak memory.
+    """
+    keys = random.Random(seed).sample(range(size * 4), size)
+    elapsed = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        operations = run(keys)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    run(keys)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return operations / elapsed, elapsed, peak
+
+
+def slope(sizes, seconds):
+    """Return the least-squares slope of log(seconds) against log(size).
+
+    About 1.0 means linear, a little above 1.0 is n log n, 2.0 is quadratic.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run(sizes, only=None, seed=0, repeat=3):
+    """Measure every selected structure at every size, print a table and return a report."""
+    results, slopes = [], {}
+    print(f"{'structure':<26} {'n':>10} {'ops/sec':>13} {'seconds':>9} {'peak MiB':>9}")
+    for name, workload in workloads().items():
+        if only and only not in name:
+            continue
+        timings = []
+        for size in sizes:
+            ops_per_sec, elapsed, peak = measure(workload, size, seed, repeat)
+            timings.append(elapsed)
+            results.append({"structure": name, "size": size, "ops_per_sec": ops_per_sec,
+                            "seconds": elapsed, "peak_bytes": peak})
+            print(f"{name:<26} {size:>10} {ops_per_sec:>13,.0f} {elapsed:>9.3f} {peak / 2**20:>9.1f}")
+        slopes[name] = slope(sizes, timings)
+        if slopes[name] is not None:
+            print(f"{name:<26} {'slope':>10} {slopes[name]:>13.2f}")
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "sizes": list(sizes), "results": results, "slopes": slopes}
+
+
+def compare(report, baseline, threshold, slope_tolerance):
+    """Return a description of every result that regressed against the baseline.
+
+    Throughput regresses when it drops by more than threshold (a fraction),
+    peak memory when it grows by more than threshold, and the slope when it
+    rises by more than slope_tolerance.
+    """
+    previous = {(row["structure"], row["size"]): row for row in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        old = previous.get((row["structure"], row["size"]))
+        if old is None:
+            continue
+        label = f"{row['structure']} n={row['size']}"
+        if row["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{label}: ops/sec {old['ops_per_sec']:,.0f} -> {row['ops_per_sec']:,.0f}")
+        if row["peak_bytes"] > old["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{label}: peak bytes {old['peak_bytes']:,} -> {row['peak_bytes']:,}")
+    for name, value in report["slopes"].items():
+        old = baseline["slopes"].get(name)
+        if value is not None and old is not None and value > old + slope_tolerance:
+            regressions.append(f"{name}: slope {old:.2f} -> {value:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report ops/sec, peak memory and big-O slope.")
+    parser.add_argument("--min-exponent", type=int, default=3, help="smallest size is 10**N")
+    parser.add_argument("--max-exponent", type=int, default=5, help="largest size is 10**N (up to 7)")
+    parser.add_argument("--only", help="only run structures whose name contains this text")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated keys")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per size, fastest is kept")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a JSON report written by --output")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional drop in ops/sec or growth in peak memory")
+    parser.add_argument("--slope-tolerance", type=float, default=0.2,
+                        help="allowed increase in the log-log slope")
+    args = parser.parse_args()
+
+    report = run([10 ** e for e in range(args.min_exponent, args.max_exponent + 1)],
+                 args.only, args.seed, args.repeat)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fp:
+            regressions = compare(report, json.load(fp), args.threshold, args.slope_tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against", args.baseline)
+
+
+if __name__ == "__main__":
+    main()
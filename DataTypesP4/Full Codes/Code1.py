@@ -1,5 +1,7 @@
 import sys
-from typing import Any, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Iterator, Optional, Tuple
 
 # -----------------------------
 # Array Implementation
@@ -37,6 +39,8 @@ class Array:
 # Binary Search Tree (BST) Implementation
 # -----------------------------
 class BSTNode:
+    __slots__ = ("key", "value", "left", "right")
+
     def __init__(self, key: int, value: Any):
         self.key = key
         self.value = value
@@ -48,59 +52,101 @@ class BST:
         self.root: Optional[BSTNode] = None
 
     def insert(self, key: int, value: Any):
-        def _insert(node: Optional[BSTNode], key: int, value: Any) -> BSTNode:
-            if node is None:
-                return BSTNode(key, value)
-            if key < node.key:
-                node.left = _insert(node.left, key, value)
-            elif key > node.key:
-                node.right = _insert(node.right, key, value)
-            return node
-
-        self.root = _insert(self.root, key, value)
+        parent, node = None, self.root
+        while node is not None:
+            if key == node.key:
+                return
+            parent, node = node, node.left if key < node.key else node.right
+
+        node = BSTNode(key, value)
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
 
     def search(self, key: int) -> Any:
-        def _search(node: Optional[BSTNode], key: int) -> Any:
-            if node is None:
-                return None
-            if key == node.key:
-                return node.value
-            elif key < node.key:
-                return _search(node.left, key)
+        node = self.root
+        while node is not None and key != node.key:
+            node = node.left if key < node.key else node.right
+        return node.value if node else None
+
+    def iter_inorder(self) -> Iterator[Tuple[int, Any]]:
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.right
+
+    def iter_reverse_inorder(self) -> Iterator[Tuple[int, Any]]:
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.left
+
+    def iter_preorder(self) -> Iterator[Tuple[int, Any]]:
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield (node.key, node.value)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self) -> Iterator[Tuple[int, Any]]:
+        stack = []
+        node = self.root
+        last_visited: Optional[BSTNode] = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
             else:
-                return _search(node.right, key)
-
-        return _search(self.root, key)
+                top = stack[-1]
+                if top.right and last_visited is not top.right:
+                    node = top.right
+                else:
+                    yield (top.key, top.value)
+                    last_visited = stack.pop()
+
+    def iter_level_order(self) -> Iterator[Tuple[int, Any]]:
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield (node.key, node.value)
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        return self.iter_inorder()
+
+    def __reversed__(self) -> Iterator[Tuple[int, Any]]:
+        return self.iter_reverse_inorder()
 
     def inorder(self):
-        result = []
-        def _inorder(node: Optional[BSTNode]):
-            if node:
-                _inorder(node.left)
-                result.append((node.key, node.value))
-                _inorder(node.right)
-        _inorder(self.root)
-        return result
+        return list(self.iter_inorder())
 
     def preorder(self):
-        result = []
-        def _preorder(node: Optional[BSTNode]):
-            if node:
-                result.append((node.key, node.value))
-                _preorder(node.left)
-                _preorder(node.right)
-        _preorder(self.root)
-        return result
+        return list(self.iter_preorder())
 
     def postorder(self):
-        result = []
-        def _postorder(node: Optional[BSTNode]):
-            if node:
-                _postorder(node.left)
-                _postorder(node.right)
-                result.append((node.key, node.value))
-        _postorder(self.root)
-        return result
+        return list(self.iter_postorder())
+
+    def level_order(self):
+        return list(self.iter_level_order())
 
 # -----------------------------
 # Union Operations Using Sets
@@ -126,6 +172,8 @@ class UnionOperations:
 # Linked List Implementation
 # -----------------------------
 class LinkedListNode:
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any):
         self.data = data
         self.next: Optional['LinkedListNode'] = None
@@ -133,11 +181,29 @@ class LinkedListNode:
 class LinkedList:
     def __init__(self):
         self.head: Optional[LinkedListNode] = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        # Stream values lazily so callers can stop early without copying the list
+        temp = self.head
+        while temp:
+            yield temp.data
+            temp = temp.next
+
+    def __contains__(self, key: Any) -> bool:
+        return self.search(key)
+
+    def window(self, start: int, stop: Optional[int] = None) -> Iterator[Any]:
+        return islice(self, start, stop)
 
     def insert(self, data: Any):
         new_node = LinkedListNode(data)
         new_node.next = self.head
         self.head = new_node
+        self.size += 1
 
     def delete(self, key: Any):
         temp = self.head
@@ -150,6 +216,7 @@ class LinkedList:
                 prev.next = temp.next
             else:
                 self.head = temp.next
+            self.size -= 1
 
     def search(self, key: Any) -> bool:
         temp = self.head
@@ -160,17 +227,14 @@ class LinkedList:
         return False
 
     def traverse(self):
-        result = []
-        temp = self.head
-        while temp:
-            result.append(temp.data)
-            temp = temp.next
-        return result
+        return list(self)
 
 # -----------------------------
 # Record Implementation (Person Class)
 # -----------------------------
 class Person:
+    __slots__ = ("name", "age", "address")
+
     def __init__(self, name: str, age: int, address: str):
         self.name = name
         self.age = age
@@ -204,6 +268,10 @@ def main():
     bst.insert(15, "Value15")
     print("Inorder traversal:", bst.inorder())
     print("Search key 15:", bst.search(15))
+    chain = BST()
+    for key in range(5000):
+        chain.insert(key, key)
+    print("Search key 4999 after sorted inserts:", chain.search(4999))
 
     print("\n# UNION TEST")
     sets = UnionOperations({1, 2, 3}, {3, 4, 5})
@@ -1,8 +1,132 @@
+import csv
+import mmap
+import pickle
+import struct
+import sys
+import threading
 import typing
-from typing import Any, Optional, Generic, TypeVar, List
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+from typing import Any, BinaryIO, Optional, Generic, TypeVar, List, Iterator, Tuple
 import unittest
 
 
+# Binary serialization helpers shared by the tree and list classes.
+# A file is a 4-byte magic tag, a node count, then one record per node whose
+# fields are each a one-byte type tag followed by the value: None and bools
+# are the tag alone, ints use the narrowest of 1/2/4/8 bytes, floats 8 bytes,
+# str (as UTF-8) and bytes a 1- or 4-byte length prefix, and anything else
+# falls back to a length-prefixed pickle.
+_COUNT = struct.Struct("<4sq")
+_LENGTH = struct.Struct("<I")
+_SHORT_LENGTH = struct.Struct("<B")
+_FLUSH_BYTES = 1 << 20
+
+_CONSTANTS = {ord("N"): None, ord("T"): True, ord("F"): False}
+_INTS = tuple((ord(code), struct.Struct("<" + code)) for code in "bhiq")
+_DOUBLE = struct.Struct("<d")
+_FIXED = {**dict(_INTS), ord("d"): _DOUBLE}
+
+
+def _decode_str(data: memoryview) -> str:
+    return str(data, "utf-8", "surrogatepass")
+
+
+_SIZED = {ord("u"): (_SHORT_LENGTH, _decode_str), ord("s"): (_LENGTH, _decode_str),
+          ord("c"): (_SHORT_LENGTH, bytes), ord("y"): (_LENGTH, bytes),
+          ord("p"): (_LENGTH, pickle.loads)}
+
+
+def _write_blob(out: bytearray, obj: Any) -> None:
+    """Append obj to out as a type tag and a compact encoding of its value."""
+    kind = type(obj)
+    if obj is None:
+        out.append(ord("N"))
+    elif kind is bool:
+        out.append(ord("T") if obj else ord("F"))
+    elif kind is int and -(1 << 63) <= obj < 1 << 63:
+        for tag, fmt in _INTS:
+            if -(1 << (8 * fmt.size - 1)) <= obj < 1 << (8 * fmt.size - 1):
+                out.append(tag)
+                out += fmt.pack(obj)
+                return
+    elif kind is float:
+        out.append(ord("d"))
+        out += _DOUBLE.pack(obj)
+    elif kind is str or kind is bytes:
+        data = obj.encode("utf-8", "surrogatepass") if kind is str else obj
+        if len(data) <= 0xFF:
+            out.append(ord("u") if kind is str else ord("c"))
+            out += _SHORT_LENGTH.pack(len(data))
+        else:
+            out.append(ord("s") if kind is str else ord("y"))
+            out += _LENGTH.pack(len(data))
+        out += data
+    else:
+        data = pickle.dumps(obj, 2)
+        out.append(ord("p"))
+        out += _LENGTH.pack(len(data))
+        out += data
+
+
+def _read_blob(view: memoryview, offset: int) -> Tuple[Any, int]:
+    """Decode one value written by _write_blob() and return it with the next offset."""
+    if offset >= len(view):
+        raise ValueError("Truncated file")
+    tag = view[offset]
+    offset += 1
+    if tag in _CONSTANTS:
+        return _CONSTANTS[tag], offset
+    if tag in _FIXED:
+        fmt = _FIXED[tag]
+        if offset + fmt.size > len(view):
+            raise ValueError("Truncated file")
+        return fmt.unpack_from(view, offset)[0], offset + fmt.size
+    if tag not in _SIZED:
+        raise ValueError("Unrecognised field type")
+    length_fmt, decode = _SIZED[tag]
+    if offset + length_fmt.size > len(view):
+        raise ValueError("Truncated file")
+    (length,) = length_fmt.unpack_from(view, offset)
+    offset += length_fmt.size
+    if offset + length > len(view):
+        raise ValueError("Truncated file")
+    return decode(view[offset:offset + length]), offset + length
+
+
+def _open_buffer(fp: BinaryIO, magic: bytes) -> Tuple[memoryview, int, Optional[int]]:
+    """
+    Map a dumped file read-only (or read it if it cannot be mapped) and check its header.
+
+    The returned view starts at the file's current position, so several
+    dumps written one after another into one file can be loaded in turn.
+    Pass the returned start and the bytes consumed to _close_buffer().
+    """
+    try:
+        start = fp.tell()
+    except (AttributeError, OSError):
+        start = None
+    try:
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(buffer)[start:]
+    except (AttributeError, OSError, ValueError, TypeError):
+        view = memoryview(fp.read())
+    if len(view) < _COUNT.size:
+        raise ValueError("Truncated or empty file")
+    tag, count = _COUNT.unpack_from(view, 0)
+    if tag != magic:
+        raise ValueError("Unrecognised file format")
+    return view, count, start
+
+
+def _close_buffer(fp: BinaryIO, start: Optional[int], consumed: int) -> None:
+    """Leave the file positioned just after the records that were loaded."""
+    if start is not None:
+        fp.seek(start + consumed)
+
+
 # 1. Arrays Implementation
 class DynamicArray:
     """
@@ -102,10 +226,338 @@ class DynamicArray:
         self._capacity = new_capacity
 
 
+class GapBuffer:
+    """
+    A sequence optimised for localized inserts and deletes around a cursor.
+    Free slots are kept as a movable gap, so edits next to the previous edit
+    only shift the elements between the old and the new cursor position.
+    """
+
+    def __init__(self, initial_capacity: int = 10):
+        """
+        Initialize an empty gap buffer.
+
+        :param initial_capacity: Starting size of the internal buffer
+        """
+        self._data = [None] * max(initial_capacity, 1)
+        self._gap_start = 0
+        self._gap_end = len(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of elements in the buffer."""
+        return len(self._data) - (self._gap_end - self._gap_start)
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Access element at a specific index.
+
+        :param index: Index of the element to retrieve
+        :return: Element at the specified index
+        :raises IndexError: If index is out of bounds
+        """
+        if 0 <= index < len(self):
+            if index < self._gap_start:
+                return self._data[index]
+            return self._data[index + self._gap_end - self._gap_start]
+        raise IndexError("Index out of bounds")
+
+    def append(self, item: Any) -> None:
+        """Add an element to the end of the buffer."""
+        self.insert(len(self), item)
+
+    def insert(self, index: int, item: Any) -> None:
+        """
+        Insert an element at a specific index.
+
+        :param index: Position to insert the element
+        :param item: Element to be inserted
+        :raises IndexError: If index is out of bounds
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError("Index out of bounds")
+        if self._gap_start == self._gap_end:
+            self._resize(2 * len(self._data))
+        self._move_gap(index)
+        self._data[self._gap_start] = item
+        self._gap_start += 1
+
+    def delete(self, index: int) -> Any:
+        """
+        Remove and return an element at a specific index.
+
+        :param index: Position of element to remove
+        :return: Removed element
+        :raises IndexError: If index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of bounds")
+        self._move_gap(index)
+        item = self._data[self._gap_end]
+        self._data[self._gap_end] = None
+        self._gap_end += 1
+        return item
+
+    def _move_gap(self, index: int) -> None:
+        """Move the gap so that it starts at the given logical index."""
+        data = self._data
+        if index < self._gap_start:
+            count = self._gap_start - index
+            data[self._gap_end - count:self._gap_end] = data[index:self._gap_start]
+            # Clear vacated slots that were not overwritten, dropping stale references
+            stale_end = min(self._gap_start, self._gap_end - count)
+            data[index:stale_end] = [None] * (stale_end - index)
+            self._gap_start -= count
+            self._gap_end -= count
+        elif index > self._gap_start:
+            count = index - self._gap_start
+            data[self._gap_start:self._gap_start + count] = data[self._gap_end:self._gap_end + count]
+            stale_start = max(self._gap_end, index)
+            data[stale_start:self._gap_end + count] = [None] * (self._gap_end + count - stale_start)
+            self._gap_start += count
+            self._gap_end += count
+
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Resize the internal buffer, widening the gap in place.
+
+        :param new_capacity: New size of the buffer
+        """
+        extra = new_capacity - len(self._data)
+        self._data[self._gap_end:self._gap_end] = [None] * extra
+        self._gap_end += extra
+
+
+class _RopeLeaf:
+    """A leaf chunk of a rope holding up to ``chunk_size`` elements."""
+
+    __slots__ = ("items",)
+    depth = 0
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+
+    @property
+    def length(self) -> int:
+        return len(self.items)
+
+
+class _RopeNode:
+    """An internal rope node caching the length and depth of its subtree."""
+
+    __slots__ = ("left", "right", "length", "depth")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.update()
+
+    def update(self) -> None:
+        self.length = self.left.length + self.right.length
+        self.depth = max(self.left.depth, self.right.depth) + 1
+
+
+class Rope:
+    """
+    A sequence stored as a height-balanced tree of small chunks.
+    Indexing, inserts and deletes anywhere in the sequence cost O(log n)
+    plus the size of one chunk.
+    """
+
+    def __init__(self, chunk_size: int = 64):
+        """
+        Initialize an empty rope.
+
+        :param chunk_size: Maximum number of elements kept in a single leaf
+        """
+        self._chunk_size = max(chunk_size, 2)
+        self._root = _RopeLeaf([])
+
+    def __len__(self) -> int:
+        """Return the number of elements in the rope."""
+        return self._root.length
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Access element at a specific index.
+
+        :param index: Index of the element to retrieve
+        :return: Element at the specified index
+        :raises IndexError: If index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of bounds")
+        node = self._root
+        while isinstance(node, _RopeNode):
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+        return node.items[index]
+
+    def __iter__(self):
+        """Yield the elements in order, one chunk at a time."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _RopeNode):
+                stack.append(node.right)
+                stack.append(node.left)
+            else:
+                yield from node.items
+
+    def append(self, item: Any) -> None:
+        """Add an element to the end of the rope."""
+        self.insert(len(self), item)
+
+    def insert(self, index: int, item: Any) -> None:
+        """
+        Insert an element at a specific index.
+
+        :param index: Position to insert the element
+        :param item: Element to be inserted
+        :raises IndexError: If index is out of bounds
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError("Index out of bounds")
+        self._root = self._insert(self._root, index, item)
+
+    def delete(self, index: int) -> Any:
+        """
+        Remove and return an element at a specific index.
+
+        :param index: Position of element to remove
+        :return: Removed element
+        :raises IndexError: If index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of bounds")
+        root, item = self._delete(self._root, index)
+        self._root = root if root is not None else _RopeLeaf([])
+        return item
+
+    def _insert(self, node, index: int, item: Any):
+        if isinstance(node, _RopeLeaf):
+            node.items.insert(index, item)
+            if len(node.items) > self._chunk_size:
+                half = len(node.items) // 2
+                return _RopeNode(_RopeLeaf(node.items[:half]), _RopeLeaf(node.items[half:]))
+            return node
+
+        if index <= node.left.length:
+            node.left = self._insert(node.left, index, item)
+        else:
+            node.right = self._insert(node.right, index - node.left.length, item)
+        return self._rebalance(node)
+
+    def _delete(self, node, index: int):
+        if isinstance(node, _RopeLeaf):
+            item = node.items.pop(index)
+            return (node if node.items else None), item
+
+        if index < node.left.length:
+            child, item = self._delete(node.left, index)
+            if child is None:
+                return node.right, item
+            node.left = child
+        else:
+            child, item = self._delete(node.right, index - node.left.length)
+            if child is None:
+                return node.left, item
+            node.right = child
+        return self._rebalance(node), item
+
+    def _rebalance(self, node: _RopeNode):
+        """Restore the AVL depth invariant at ``node`` after a child changed."""
+        node.update()
+        if node.left.depth - node.right.depth > 1:
+            if node.left.right.depth > node.left.left.depth:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if node.right.depth - node.left.depth > 1:
+            if node.right.left.depth > node.right.right.depth:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    @staticmethod
+    def _rotate_left(node: _RopeNode) -> _RopeNode:
+        pivot = node.right
+        node.right = pivot.left
+        node.update()
+        pivot.left = node
+        pivot.update()
+        return pivot
+
+    @staticmethod
+    def _rotate_right(node: _RopeNode) -> _RopeNode:
+        pivot = node.left
+        node.left = pivot.right
+        node.update()
+        pivot.right = node
+        pivot.update()
+        return pivot
+
+
+def benchmark_sequences(sizes=(1_000, 4_000, 16_000), edits: int = 500) -> None:
+    """
+    Compare DynamicArray, GapBuffer and Rope under different edit patterns
+    and report the smallest size at which each structure beats DynamicArray.
+
+    :param sizes: Sequence lengths to prefill before editing
+    :param edits: Number of insert/delete pairs performed per measurement
+    """
+    import random
+    import time
+
+    def cursor_positions(size: int):
+        cursor = size // 2
+        for _ in range(edits):
+            cursor = min(max(cursor + random.randint(-3, 3), 0), size - 1)
+            yield cursor
+
+    patterns = {
+        "append": lambda size: [size] * edits,
+        "front": lambda size: [0] * edits,
+        "localized": lambda size: list(cursor_positions(size)),
+        "random": lambda size: [random.randrange(size) for _ in range(edits)],
+    }
+    structures = {"DynamicArray": DynamicArray, "GapBuffer": GapBuffer, "Rope": Rope}
+    crossover = {}
+
+    print(f"\n# SEQUENCE EDIT BENCHMARK ({edits} insert+delete pairs)")
+    print(f"{'pattern':<10} {'size':>8} " + " ".join(f"{name:>13}" for name in structures))
+    for pattern, positions_for in patterns.items():
+        for size in sizes:
+            random.seed(size)
+            positions = positions_for(size)
+            timings = {}
+            for name, cls in structures.items():
+                seq = cls()
+                for i in range(size):
+                    seq.append(i)
+                start = time.perf_counter()
+                for position in positions:
+                    seq.insert(position, -1)
+                    seq.delete(position)
+                timings[name] = time.perf_counter() - start
+            for name in ("GapBuffer", "Rope"):
+                if timings[name] < timings["DynamicArray"]:
+                    crossover.setdefault((pattern, name), size)
+            print(f"{pattern:<10} {size:>8} " + " ".join(f"{timings[n] * 1e3:>11.2f}ms" for n in structures))
+
+    print("\nSmallest size beating DynamicArray:")
+    for pattern in patterns:
+        for name in ("GapBuffer", "Rope"):
+            print(f"  {pattern:<10} {name:<10} {crossover.get((pattern, name), 'not reached')}")
+
+
 # 2. Binary Search Tree Implementation
 class TreeNode:
     """Represents a node in a Binary Search Tree."""
 
+    __slots__ = ("key", "value", "left", "right")
+
     def __init__(self, key: Any, value: Any):
         self.key = key
         self.value = value
@@ -116,59 +568,549 @@ class TreeNode:
 class BinarySearchTree:
     """Implements a Binary Search Tree with various traversal methods."""
 
+    _node_class = TreeNode
+
     def __init__(self):
         self.root: Optional[TreeNode] = None
 
+    @classmethod
+    def from_sorted(cls, items: typing.Iterable[Tuple[Any, Any]]) -> 'BinarySearchTree':
+        """
+        Build a perfectly balanced tree in O(n) from (key, value) pairs sorted by key.
+        For repeated keys the last value wins, as with repeated inserts.
+
+        :param items: (key, value) pairs in ascending key order
+        :return: A new tree containing the pairs
+        :raises ValueError: If a key is smaller than the one before it
+        """
+        pairs: List[Tuple[Any, Any]] = []
+        for key, value in items:
+            if not pairs or pairs[-1][0] < key:
+                pairs.append((key, value))
+            elif pairs[-1][0] == key:
+                pairs[-1] = (key, value)
+            else:
+                raise ValueError(f"Keys are not sorted: {key!r} follows {pairs[-1][0]!r}")
+
+        tree = cls()
+        tree.root = tree._build_balanced(pairs, 0, len(pairs))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items: typing.Iterable[Tuple[Any, Any]]) -> 'BinarySearchTree':
+        """
+        Build a balanced tree from (key, value) pairs in any order in O(n log n).
+
+        :param items: (key, value) pairs
+        :return: A new tree containing the pairs
+        """
+        return cls.from_sorted(sorted(items, key=lambda pair: pair[0]))
+
+    def merge(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        """
+        Combine two trees into a new balanced tree in O(n + m).
+        Values from ``other`` win for keys present in both trees.
+
+        :param other: Tree to merge with this one
+        :return: A new tree of the same type holding the keys of both
+        """
+        merged: List[Tuple[Any, Any]] = []
+        left, right = self.iter_inorder(), other.iter_inorder()
+        a, b = next(left, None), next(right, None)
+        while a is not None and b is not None:
+            if a[0] < b[0]:
+                merged.append(a)
+                a = next(left, None)
+            elif b[0] < a[0]:
+                merged.append(b)
+                b = next(right, None)
+            else:
+                merged.append(b)
+                a, b = next(left, None), next(right, None)
+        if a is not None:
+            merged.append(a)
+            merged.extend(left)
+        if b is not None:
+            merged.append(b)
+            merged.extend(right)
+        return type(self).from_sorted(merged)
+
+    def _build_balanced(self, pairs: List[Tuple[Any, Any]], lo: int, hi: int) -> Optional[TreeNode]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._node_class(*pairs[mid])
+        node.left = self._build_balanced(pairs, lo, mid)
+        node.right = self._build_balanced(pairs, mid + 1, hi)
+        self._update(node)
+        return node
+
+    def _update(self, node: TreeNode) -> None:
+        """Refresh any cached per-node metadata; plain nodes carry none."""
+
     def insert(self, key: Any, value: Any) -> None:
         """
         Insert a key-value pair into the BST.
+        Walks down without recursion, since sorted inserts make the tree as deep as it is long.
+
+        :param key: Key to be inserted
+        :param value: Corresponding value
+        """
+        parent = None
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                parent, node = node, node.left
+            elif key > node.key:
+                parent, node = node, node.right
+            else:
+                node.value = value  # Update value if key exists
+                return
+
+        node = self._node_class(key, value)
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Search for a value by key.
+
+        :param key: Key to search for
+        :return: Value associated with the key or None
+        """
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node.value if node else None
+
+    def iter_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs in ascending key order using an explicit stack."""
+        stack: List[TreeNode] = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.right
+
+    def iter_reverse_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs in descending key order using an explicit stack."""
+        stack: List[TreeNode] = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.left
+
+    def iter_preorder(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs in preorder using an explicit stack."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield (node.key, node.value)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs in postorder using an explicit stack."""
+        stack: List[TreeNode] = []
+        node = self.root
+        last_visited: Optional[TreeNode] = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and last_visited is not top.right:
+                    node = top.right
+                else:
+                    yield (top.key, top.value)
+                    last_visited = stack.pop()
+
+    def iter_level_order(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs level by level, left to right."""
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield (node.key, node.value)
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over (key, value) pairs in ascending order with O(height) memory."""
+        return self.iter_inorder()
+
+    def __reversed__(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over (key, value) pairs in descending order with O(height) memory."""
+        return self.iter_reverse_inorder()
+
+    def inorder_traversal(self) -> List[Any]:
+        """Perform an inorder traversal of the BST."""
+        return list(self.iter_inorder())
+
+    _MAGIC = b"BST2"
+    _HAS_LEFT, _HAS_RIGHT = 1, 2
+
+    def dump(self, fp: BinaryIO) -> None:
+        """
+        Write the tree to a binary file as a preorder stream of nodes.
+        Each record is a flags byte saying which children follow, then the
+        type-tagged key and value.
+
+        :param fp: File object opened for binary writing
+        """
+        out = bytearray()
+        count = 0
+        stack = [self.root] if self.root else []
+        start = fp.tell()
+        fp.write(_COUNT.pack(self._MAGIC, 0))
+        while stack:
+            node = stack.pop()
+            out.append((self._HAS_LEFT if node.left else 0) | (self._HAS_RIGHT if node.right else 0))
+            _write_blob(out, node.key)
+            _write_blob(out, node.value)
+            count += 1
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+            if len(out) >= _FLUSH_BYTES:
+                fp.write(out)
+                out.clear()
+        fp.write(out)
+        # Patch the node count into the header now that it is known
+        end = fp.tell()
+        fp.seek(start)
+        fp.write(_COUNT.pack(self._MAGIC, count))
+        fp.seek(end)
+
+    @classmethod
+    def load(cls, fp: BinaryIO) -> 'BinarySearchTree':
+        """
+        Rebuild a tree written by dump() in a single pass without recursion.
+        The file is memory-mapped when possible.
+
+        :param fp: File object opened for binary reading
+        :return: A new tree with the same shape, keys and values
+        """
+        view, count, start = _open_buffer(fp, cls._MAGIC)
+        tree = cls()
+        offset = _COUNT.size
+        # Preorder means the next record always fills the most recently opened child slot
+        slots: List[Tuple[Optional[TreeNode], bool]] = [(None, False)]
+        nodes: List[TreeNode] = []
+        for _ in range(count):
+            if offset >= len(view):
+                raise ValueError("Truncated file")
+            flags = view[offset]
+            key, offset = _read_blob(view, offset + 1)
+            value, offset = _read_blob(view, offset)
+            node = tree._node_class(key, value)
+            parent, is_right = slots.pop()
+            if parent is None:
+                tree.root = node
+            elif is_right:
+                parent.right = node
+            else:
+                parent.left = node
+            if flags & cls._HAS_RIGHT:
+                slots.append((node, True))
+            if flags & cls._HAS_LEFT:
+                slots.append((node, False))
+            nodes.append(node)
+        # Children always follow their parent in preorder, so a reverse sweep is bottom-up
+        for node in reversed(nodes):
+            tree._update(node)
+        _close_buffer(fp, start, offset)
+        return tree
+
+
+class AVLTreeNode(TreeNode):
+    """Represents a Binary Search Tree node that caches its subtree height."""
+
+    __slots__ = ("height",)
+
+    def __init__(self, key: Any, value: Any):
+        super().__init__(key, value)
+        self.height = 1
+
+
+class AVLTree(BinarySearchTree):
+    """
+    A self-balancing Binary Search Tree using AVL rotations.
+    Insert, delete and search stay O(log n) even for sorted input.
+    """
+
+    _node_class = AVLTreeNode
+
+    def height(self) -> int:
+        """Return the height of the tree in constant time."""
+        return self._height(self.root)
+
+    def delete(self, key: Any) -> bool:
+        """
+        Delete a key and its value from the tree.
+
+        :param key: Key to delete
+        :return: True if deleted, False if not found
+        """
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        self.root = self._delete_recursive(self.root, key)
+        return True
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Insert a key-value pair, rebalancing on the way back up.
+        Recursion is safe here because the height stays O(log n).
 
         :param key: Key to be inserted
         :param value: Corresponding value
         """
         self.root = self._insert_recursive(self.root, key, value)
 
-    def _insert_recursive(self, node: Optional[TreeNode], key: Any, value: Any) -> TreeNode:
+    def _insert_recursive(self, node: Optional[AVLTreeNode], key: Any, value: Any) -> AVLTreeNode:
         if node is None:
-            return TreeNode(key, value)
+            return self._node_class(key, value)
 
         if key < node.key:
             node.left = self._insert_recursive(node.left, key, value)
         elif key > node.key:
             node.right = self._insert_recursive(node.right, key, value)
         else:
-            node.value = value  # Update value if key exists
+            node.value = value
+            return node
+
+        return self._rebalance(node)
 
+    def _delete_recursive(self, node: Optional[AVLTreeNode], key: Any) -> Optional[AVLTreeNode]:
+        if node is None:
+            return None
+
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node.right = self._delete_min(node.right)
+
+        return self._rebalance(node)
+
+    def _delete_min(self, node: AVLTreeNode) -> Optional[AVLTreeNode]:
+        if node.left is None:
+            return node.right
+        node.left = self._delete_min(node.left)
+        return self._rebalance(node)
+
+    @staticmethod
+    def _height(node: Optional[AVLTreeNode]) -> int:
+        return node.height if node else 0
+
+    def _update(self, node: AVLTreeNode) -> None:
+        node.height = max(self._height(node.left), self._height(node.right)) + 1
+
+    def _rotate_left(self, node: AVLTreeNode) -> AVLTreeNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: AVLTreeNode) -> AVLTreeNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: AVLTreeNode) -> AVLTreeNode:
+        """Update the cached height and rotate if the subtrees differ by more than one."""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
         return node
 
-    def search(self, key: Any) -> Optional[Any]:
+
+class TreeSnapshot(BinarySearchTree):
+    """
+    A read-only view of a ConcurrentBinarySearchTree at one point in time.
+    Its nodes are never modified, so it can be searched and iterated without locks.
+    """
+
+    def __init__(self, root: Optional[TreeNode] = None):
+        super().__init__()
+        self.root = root
+
+    def insert(self, key: Any, value: Any) -> None:
+        raise TypeError("Tree snapshots are read-only")
+
+
+class ConcurrentBinarySearchTree(BinarySearchTree):
+    """
+    A Binary Search Tree that can be shared between threads.
+
+    Writers serialize on a lock and use path copying: instead of changing
+    nodes in place they copy the nodes on the path to the change and then
+    publish the new root with a single assignment. Published nodes are
+    therefore immutable, and readers never need the lock.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> TreeSnapshot:
+        """Return an immutable view of the current version of the tree."""
+        return TreeSnapshot(self.root)
+
+    def insert(self, key: Any, value: Any) -> None:
         """
-        Search for a value by key.
+        Insert or update a key-value pair by copying the path from the root.
 
-        :param key: Key to search for
-        :return: Value associated with the key or None
+        :param key: Key to be inserted
+        :param value: Corresponding value
         """
-        return self._search_recursive(self.root, key)
+        with self._write_lock:
+            path: List[TreeNode] = []
+            node = self.root
+            while node is not None and node.key != key:
+                path.append(node)
+                node = node.left if key < node.key else node.right
+            replacement = self._node_class(key, value)
+            if node is not None:
+                replacement.left, replacement.right = node.left, node.right
+            self.root = self._copy_path(path, key, replacement)
+
+    def delete(self, key: Any) -> bool:
+        """
+        Delete a key by copying the path from the root.
 
-    def _search_recursive(self, node: Optional[TreeNode], key: Any) -> Optional[Any]:
-        if node is None or node.key == key:
-            return node.value if node else None
+        :param key: Key to delete
+        :return: True if deleted, False if not found
+        """
+        with self._write_lock:
+            path: List[TreeNode] = []
+            node = self.root
+            while node is not None and node.key != key:
+                path.append(node)
+                node = node.left if key < node.key else node.right
+            if node is None:
+                return False
+
+            if node.left is None:
+                replacement = node.right
+            elif node.right is None:
+                replacement = node.left
+            else:
+                # Copy the path down to the in-order successor and splice it out
+                successor_path: List[TreeNode] = []
+                successor = node.right
+                while successor.left is not None:
+                    successor_path.append(successor)
+                    successor = successor.left
+                new_right = self._copy_path(successor_path, successor.key, successor.right)
+                replacement = self._node_class(successor.key, successor.value)
+                replacement.left, replacement.right = node.left, new_right
+            self.root = self._copy_path(path, key, replacement)
+            return True
 
-        if key < node.key:
-            return self._search_recursive(node.left, key)
-        return self._search_recursive(node.right, key)
+    def _copy_path(self, path: List[TreeNode], key: Any, child: Optional[TreeNode]) -> Optional[TreeNode]:
+        """Copy the nodes on ``path`` bottom-up, hanging ``child`` where ``key`` belongs."""
+        for original in reversed(path):
+            copy = self._node_class(original.key, original.value)
+            copy.left, copy.right = original.left, original.right
+            if key < original.key:
+                copy.left = child
+            else:
+                copy.right = child
+            child = copy
+        return child
 
-    def inorder_traversal(self) -> List[Any]:
-        """Perform an inorder traversal of the BST."""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
 
-    def _inorder_recursive(self, node: Optional[TreeNode], result: List[Any]) -> None:
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append((node.key, node.value))
-            self._inorder_recursive(node.right, result)
+def benchmark_concurrent_reads(size: int = 20_000, readers: int = 4, duration: float = 1.0) -> None:
+    """
+    Measure snapshot lookups per second from reader threads, alone and while
+    a writer thread keeps inserting.
+
+    :param size: Number of keys preloaded into the tree
+    :param readers: Number of reader threads
+    :param duration: Seconds to run each measurement
+    """
+    import random
+    import time
+
+    tree = ConcurrentBinarySearchTree.from_iterable((key, key) for key in random.sample(range(size * 2), size))
+
+    def run(with_writer: bool) -> Tuple[float, int]:
+        stop = threading.Event()
+        reads = [0] * readers
+        writes = [0]
+
+        def reader(slot: int) -> None:
+            rng = random.Random(slot)
+            while not stop.is_set():
+                snapshot = tree.snapshot()
+                for _ in range(100):
+                    snapshot.search(rng.randrange(size * 2))
+                reads[slot] += 100
+
+        def writer() -> None:
+            rng = random.Random(-1)
+            while not stop.is_set():
+                tree.insert(rng.randrange(size * 2), None)
+                writes[0] += 1
+
+        threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+        if with_writer:
+            threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return sum(reads) / duration, writes[0]
+
+    print(f"\n# CONCURRENT TREE BENCHMARK ({readers} readers, {size} keys)")
+    for with_writer in (False, True):
+        rate, writes = run(with_writer)
+        label = f"with writer ({writes / duration:,.0f} inserts/s)" if with_writer else "readers only"
+        print(f"{label:<36} {rate:>12,.0f} lookups/s")
 
 
 # 3. Union Data Structure
@@ -178,46 +1120,158 @@ T = TypeVar('T')
 class UnionSet(Generic[T]):
     """
     Implements a set-like data structure with union operations.
-    Uses a dictionary for efficient storage and lookup.
+    Backed by a native set, so bulk operations run as C-level set algebra.
     """
 
-    def __init__(self):
-        self._data: typing.Dict[T, bool] = {}
+    def __init__(self, items: typing.Iterable[T] = ()):
+        self._data: typing.Set[T] = set(items)
+
+    @classmethod
+    def _wrap(cls, data: typing.Set[T]) -> 'UnionSet[T]':
+        result = cls()
+        result._data = data
+        return result
+
+    @staticmethod
+    def _as_set(other: typing.Union['UnionSet[T]', typing.Iterable[T]]) -> typing.Iterable[T]:
+        """Return the backing set of a UnionSet, or any other iterable unchanged.
+
+        Callers pass the result to named set methods, which accept any iterable.
+        """
+        return other._data if isinstance(other, UnionSet) else other
+
+    @staticmethod
+    def _as_sized(other: typing.Union['UnionSet[T]', typing.Iterable[T]]) -> typing.AbstractSet[T]:
+        """Return other as a native set, copying only operands that are not sets already."""
+        if isinstance(other, UnionSet):
+            return other._data
+        return other if isinstance(other, (set, frozenset)) else set(other)
 
     def add(self, item: T) -> None:
         """Add an item to the set."""
-        self._data[item] = True
+        self._data.add(item)
 
     def remove(self, item: T) -> None:
         """Remove an item from the set."""
-        self._data.pop(item, None)
+        self._data.discard(item)
+
+    def update(self, *iterables: typing.Iterable[T]) -> None:
+        """Add every item from any number of iterables in place."""
+        self._data.update(*(self._as_set(items) for items in iterables))
 
     def __contains__(self, item: T) -> bool:
         """Check if an item is in the set."""
         return item in self._data
 
+    def __len__(self) -> int:
+        """Return the number of items in the set."""
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items in the set."""
+        return iter(self._data)
+
     def union(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
         """Perform a union operation with another set."""
-        result = UnionSet[T]()
-        for item in self._data:
+        return self._wrap(self._data.union(self._as_set(other)))
+
+    def intersection(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        """Perform an intersection operation with another set, iterating the smaller one."""
+        small, large = sorted((self._data, self._as_sized(other)), key=len)
+        return self._wrap(small.intersection(large))
+
+    def difference(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        """Return the items of this set that are not in the other."""
+        return self._wrap(self._data.difference(self._as_set(other)))
+
+    def symmetric_difference(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        """Return the items that are in exactly one of the two sets."""
+        return self._wrap(self._data.symmetric_difference(self._as_set(other)))
+
+    def __ior__(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        self._data.update(self._as_set(other))
+        return self
+
+    def __iand__(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        self._data.intersection_update(self._as_set(other))
+        return self
+
+    def __isub__(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        self._data.difference_update(self._as_set(other))
+        return self
+
+    def __ixor__(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
+        self._data.symmetric_difference_update(self._as_set(other))
+        return self
+
+    @classmethod
+    def union_all(cls, *sets: 'UnionSet[T]') -> 'UnionSet[T]':
+        """Return the union of any number of sets in a single pass."""
+        return cls._wrap(set().union(*(cls._as_set(other) for other in sets)))
+
+    @classmethod
+    def intersection_all(cls, *sets: 'UnionSet[T]') -> 'UnionSet[T]':
+        """Return the intersection of any number of sets, smallest first."""
+        if not sets:
+            return cls()
+        ordered = sorted((cls._as_sized(other) for other in sets), key=len)
+        if len(ordered) == 1:
+            return cls._wrap(set(ordered[0]))
+        result = ordered[0].intersection(ordered[1])
+        for other in ordered[2:]:
+            if not result:
+                break
+            result.intersection_update(other)
+        return cls._wrap(result)
+
+
+def benchmark_union_set(size: int = 1_000_000) -> None:
+    """
+    Compare UnionSet bulk operations with the element-by-element loops
+    they replace.
+
+    :param size: Number of items in each operand
+    """
+    import time
+
+    a = UnionSet(range(size))
+    b = UnionSet(range(size // 2, size + size // 2))
+    small = UnionSet(range(0, size, 1000))
+
+    def loop_union():
+        result = UnionSet()
+        for item in a:
             result.add(item)
-        for item in other._data:
+        for item in b:
             result.add(item)
-        return result
 
-    def intersection(self, other: 'UnionSet[T]') -> 'UnionSet[T]':
-        """Perform an intersection operation with another set."""
-        result = UnionSet[T]()
-        for item in self._data:
-            if item in other:
+    def loop_intersection():
+        result = UnionSet()
+        for item in a:
+            if item in small:
                 result.add(item)
-        return result
+
+    cases = [
+        ("union, per-item loop", loop_union),
+        ("union", lambda: a.union(b)),
+        ("intersection with small set, per-item loop", loop_intersection),
+        ("intersection with small set", lambda: a.intersection(small)),
+        ("union_all of 10 sets", lambda: UnionSet.union_all(*[a, b] * 5)),
+        ("intersection_all of 10 sets", lambda: UnionSet.intersection_all(*[a, b, small] * 3, a)),
+    ]
+    print(f"\n# UNION SET BENCHMARK ({size:,} items per operand)")
+    for label, operation in cases:
+        start = time.perf_counter()
+        operation()
+        print(f"{label:<44} {(time.perf_counter() - start) * 1e3:>9.1f}ms")
 
 
 # 4. Linked List Implementation
 class LinkedListNode:
     """Represents a node in a Linked List."""
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any):
         self.data = data
         self.next: Optional[LinkedListNode] = None
@@ -228,12 +1282,38 @@ class LinkedList:
 
     def __init__(self):
         self.head: Optional[LinkedListNode] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the list."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield node values lazily from the head, using constant extra memory."""
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, data: Any) -> bool:
+        """Check if a value exists in the linked list."""
+        return self.search(data)
+
+    def window(self, start: int, stop: Optional[int] = None) -> Iterator[Any]:
+        """
+        Lazily yield the values between two positions, like itertools.islice.
+
+        :param start: Position of the first value to yield
+        :param stop: Position to stop before, or None to run to the end
+        """
+        return islice(self, start, stop)
 
     def insert_front(self, data: Any) -> None:
         """Insert a new node at the front of the list."""
         new_node = LinkedListNode(data)
         new_node.next = self.head
         self.head = new_node
+        self._size += 1
 
     def delete(self, data: Any) -> bool:
         """
@@ -246,12 +1326,14 @@ class LinkedList:
 
         if self.head.data == data:
             self.head = self.head.next
+            self._size -= 1
             return True
 
         current = self.head
         while current.next:
             if current.next.data == data:
                 current.next = current.next.next
+                self._size -= 1
                 return True
             current = current.next
 
@@ -266,6 +1348,187 @@ class LinkedList:
             current = current.next
         return False
 
+    _MAGIC = b"LLS2"
+
+    def dump(self, fp: BinaryIO) -> None:
+        """
+        Write the list to a binary file as type-tagged values, head first.
+
+        :param fp: File object opened for binary writing
+        """
+        fp.write(_COUNT.pack(self._MAGIC, len(self)))
+        out = bytearray()
+        for data in self:
+            _write_blob(out, data)
+            if len(out) >= _FLUSH_BYTES:
+                fp.write(out)
+                out.clear()
+        fp.write(out)
+
+    @classmethod
+    def load(cls, fp: BinaryIO) -> 'LinkedList':
+        """
+        Rebuild a list written by dump() in a single streaming pass.
+
+        :param fp: File object opened for binary reading
+        :return: A new list holding the same values in the same order
+        """
+        view, count, start = _open_buffer(fp, cls._MAGIC)
+        offset = _COUNT.size
+
+        def values() -> Iterator[Any]:
+            nonlocal offset
+            for _ in range(count):
+                data, offset = _read_blob(view, offset)
+                yield data
+
+        lst = cls()
+        lst._extend_back(values())
+        _close_buffer(fp, start, offset)
+        return lst
+
+    def _extend_back(self, values: typing.Iterable[Any]) -> None:
+        """Append values after the current last node in one pass."""
+        tail = self.head
+        while tail and tail.next:
+            tail = tail.next
+        for data in values:
+            node = LinkedListNode(data)
+            if tail:
+                tail.next = node
+            else:
+                self.head = node
+            tail = node
+            self._size += 1
+
+
+class DoublyLinkedListNode(LinkedListNode):
+    """Represents a node that also links back to its predecessor."""
+
+    __slots__ = ("prev",)
+
+    def __init__(self, data: Any):
+        super().__init__(data)
+        self.prev: Optional[DoublyLinkedListNode] = None
+
+
+class IndexedLinkedList(LinkedList):
+    """
+    A doubly linked list with a value-to-node hash index.
+
+    Every value maps to the set of nodes holding it, kept in list order, so
+    search and delete-by-value run in O(1) average time even with duplicates.
+    Only insert_front pays O(k) for a value already held by k nodes.
+    Values must be hashable. Together with move_to_end and pop_front this
+    makes the list usable as the recency queue of an LRU cache.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tail: Optional[DoublyLinkedListNode] = None
+        self._index: typing.Dict[Any, typing.Dict[DoublyLinkedListNode, None]] = {}
+
+    def insert_front(self, data: Any) -> DoublyLinkedListNode:
+        """Insert a new node at the front of the list and return it."""
+        node = DoublyLinkedListNode(data)
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
+        self._link(node, front=True)
+        return node
+
+    def insert_back(self, data: Any) -> DoublyLinkedListNode:
+        """Insert a new node at the back of the list and return it."""
+        node = DoublyLinkedListNode(data)
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self._link(node)
+        return node
+
+    def delete(self, data: Any) -> bool:
+        """
+        Delete the node nearest the head holding the given data.
+
+        :return: True if deleted, False if not found
+        """
+        nodes = self._index.get(data)
+        if not nodes:
+            return False
+        self.remove_node(next(iter(nodes)))
+        return True
+
+    def search(self, data: Any) -> bool:
+        """Check if a value exists in the linked list."""
+        return data in self._index
+
+    def remove_node(self, node: DoublyLinkedListNode) -> Any:
+        """
+        Unlink a node in constant time and return its data.
+
+        :param node: A node previously returned by one of the insert methods
+        :raises ValueError: If the node was already removed
+        """
+        if node.prev is None and node is not self.head:
+            raise ValueError("Node is not in this list")
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+
+        nodes = self._index[node.data]
+        del nodes[node]
+        if not nodes:
+            del self._index[node.data]
+        self._size -= 1
+        return node.data
+
+    def move_to_end(self, data: Any) -> bool:
+        """
+        Move the node nearest the head holding the data to the back.
+
+        :return: True if moved, False if not found
+        """
+        if not self.delete(data):
+            return False
+        self.insert_back(data)
+        return True
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the value at the front of the list.
+
+        :raises IndexError: If the list is empty
+        """
+        if not self.head:
+            raise IndexError("List is empty")
+        return self.remove_node(self.head)
+
+    def _extend_back(self, values: typing.Iterable[Any]) -> None:
+        for data in values:
+            self.insert_back(data)
+
+    def _link(self, node: DoublyLinkedListNode, front: bool = False) -> None:
+        nodes = self._index.get(node.data)
+        if nodes is None:
+            self._index[node.data] = {node: None}
+        elif front:
+            self._index[node.data] = {node: None, **nodes}
+        else:
+            nodes[node] = None
+        self._size += 1
+
 
 # 5. Record/Person Class
 class Person:
@@ -274,6 +1537,8 @@ class Person:
     Demonstrates object-oriented record implementation.
     """
 
+    __slots__ = ("name", "age", "address")
+
     def __init__(self, name: str, age: int, address: str):
         self.name = name
         self.age = age
@@ -284,6 +1549,222 @@ class Person:
         return f"{self.name} (Age: {self.age}, Address: {self.address})"
 
 
+class PersonRow(Person):
+    """
+    A Person-compatible view of one row of a PersonTable.
+
+    Reading an attribute reads the table's column, and assigning one writes
+    back through the table so its indexes stay correct.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: 'PersonTable', row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._table.set_name(self._row, value)
+
+    @property
+    def age(self) -> int:
+        return self._table.ages[self._row]
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self._table.set_age(self._row, value)
+
+    @property
+    def address(self) -> str:
+        return self._table.addresses[self._row]
+
+    @address.setter
+    def address(self, value: str) -> None:
+        self._table.addresses[self._row] = sys.intern(value)
+
+
+class PersonTable:
+    """
+    Stores many people as columns instead of one object per record.
+
+    Names and addresses are interned so repeated strings share one object,
+    and ages live in a typed integer array. A name hash index answers
+    exact-name lookups in O(1), and a sorted age index, rebuilt lazily after
+    changes, answers age range filters with two binary searches.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ages = array("q")
+        self.addresses: List[str] = []
+        self._by_name: typing.Dict[str, array] = {}
+        self._age_keys = array("q")
+        self._age_rows = array("q")
+        self._age_index_valid = True
+
+    def __len__(self) -> int:
+        """Return the number of rows in the table."""
+        return len(self.ages)
+
+    def __getitem__(self, row: int) -> PersonRow:
+        """Return a Person-compatible view of a row."""
+        if row < 0:
+            row += len(self.ages)
+        if not 0 <= row < len(self.ages):
+            raise IndexError("PersonTable index out of range")
+        return PersonRow(self, row)
+
+    def __iter__(self) -> Iterator[PersonRow]:
+        """Yield a view of every row in insertion order."""
+        for row in range(len(self.ages)):
+            yield PersonRow(self, row)
+
+    def append(self, name: str, age: int, address: str) -> int:
+        """
+        Add a person and return their row number.
+
+        :param name: Person's name
+        :param age: Person's age
+        :param address: Person's address
+        """
+        row = len(self.ages)
+        name = sys.intern(name)
+        self.names.append(name)
+        self.ages.append(age)
+        self.addresses.append(sys.intern(address))
+        self._by_name.setdefault(name, array("q")).append(row)
+        self._age_index_valid = False
+        return row
+
+    def extend(self, rows: typing.Iterable[Tuple[str, int, str]]) -> None:
+        """Add every (name, age, address) tuple from an iterable."""
+        for name, age, address in rows:
+            self.append(name, age, address)
+
+    @classmethod
+    def from_csv(cls, source: typing.Union[str, typing.TextIO]) -> 'PersonTable':
+        """
+        Stream rows from a CSV file with name, age and address columns.
+
+        Rows are read one at a time, so only the columns are kept in memory.
+
+        :param source: A path or an open text file whose header names the columns
+        """
+        if isinstance(source, str):
+            with open(source, newline="") as fp:
+                return cls.from_csv(fp)
+        reader = csv.reader(source)
+        header = [column.strip().lower() for column in next(reader, [])]
+        try:
+            name_col, age_col, address_col = (header.index(column)
+                                               for column in ("name", "age", "address"))
+        except ValueError:
+            raise ValueError("CSV header must contain name, age and address columns")
+        table = cls()
+        for record in reader:
+            if record:
+                table.append(record[name_col], int(record[age_col]), record[address_col])
+        return table
+
+    def set_name(self, row: int, name: str) -> None:
+        """Rename a row and move it to the new name's index entry."""
+        rows = self._by_name[self.names[row]]
+        rows.remove(row)
+        if not rows:
+            del self._by_name[self.names[row]]
+        name = sys.intern(name)
+        self.names[row] = name
+        bucket = self._by_name.setdefault(name, array("q"))
+        bucket.insert(bisect_left(bucket, row), row)
+
+    def set_age(self, row: int, age: int) -> None:
+        """Change a row's age and invalidate the age index."""
+        self.ages[row] = age
+        self._age_index_valid = False
+
+    def find_by_name(self, name: str) -> List[PersonRow]:
+        """Return a view of every row with exactly this name."""
+        return [PersonRow(self, row) for row in self._by_name.get(name, ())]
+
+    def _ensure_age_index(self) -> None:
+        if not self._age_index_valid:
+            ages = self.ages
+            order = sorted(range(len(ages)), key=ages.__getitem__)
+            self._age_rows = array("q", order)
+            self._age_keys = array("q", (ages[row] for row in order))
+            self._age_index_valid = True
+
+    def filter_age(self, low: int, high: int) -> Iterator[PersonRow]:
+        """
+        Yield the people whose age is between low and high inclusive, youngest first.
+
+        :param low: Smallest age to include
+        :param high: Largest age to include
+        """
+        self._ensure_age_index()
+        start = bisect_left(self._age_keys, low)
+        stop = bisect_right(self._age_keys, high)
+        for row in self._age_rows[start:stop]:
+            yield PersonRow(self, row)
+
+    def count_age(self, low: int, high: int) -> int:
+        """Count the people whose age is between low and high inclusive."""
+        self._ensure_age_index()
+        return bisect_right(self._age_keys, high) - bisect_left(self._age_keys, low)
+
+
+def benchmark_person_table(size: int = 1_000_000) -> None:
+    """
+    Compare the memory and query time of PersonTable with a list of Person objects.
+
+    :param size: Number of people to store
+    """
+    import random
+    import time
+    import tracemalloc
+
+    names = [f"name-{i}" for i in range(size // 10)]
+    streets = [f"{i} Main St" for i in range(1000)]
+    rows = [(random.choice(names), random.randint(0, 99), random.choice(streets))
+            for _ in range(size)]
+
+    def build_objects():
+        return [Person(name, age, address) for name, age, address in rows]
+
+    def build_table():
+        table = PersonTable()
+        table.extend(rows)
+        return table
+
+    print(f"\n# PERSON TABLE BENCHMARK ({size:,} people)")
+    for label, build, by_name, by_age in (
+            ("list of Person", build_objects,
+             lambda people: [p for p in people if p.name == "name-7"],
+             lambda people: sum(1 for p in people if 30 <= p.age <= 39)),
+            ("PersonTable", build_table,
+             lambda table: table.find_by_name("name-7"),
+             lambda table: table.count_age(30, 39))):
+        tracemalloc.start()
+        structure = build()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        by_age(structure)  # Builds the lazy age index outside the timed query
+        start = time.perf_counter()
+        by_name(structure)
+        name_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        by_age(structure)
+        age_seconds = time.perf_counter() - start
+        print(f"{label:<15} {memory / size:6.1f} bytes/person, name lookup "
+              f"{name_seconds * 1e3:8.3f}ms, age range count {age_seconds * 1e3:8.3f}ms")
+        del structure
+
+
 # 6. Pointer Demonstration
 def pointer_demo() -> None:
     """
@@ -324,6 +1805,25 @@ class DataStructuresTest(unittest.TestCase):
         self.assertEqual(arr[1], 3)
         self.assertEqual(arr.delete(1), 3)
 
+    def test_edit_sequences(self):
+        import random
+        random.seed(7)
+        for cls in (GapBuffer, lambda: Rope(chunk_size=4)):
+            seq = cls()
+            expected = []
+            for step in range(500):
+                if expected and step % 3 == 0:
+                    index = random.randrange(len(expected))
+                    self.assertEqual(seq.delete(index), expected.pop(index))
+                else:
+                    index = random.randint(0, len(expected))
+                    seq.insert(index, step)
+                    expected.insert(index, step)
+            self.assertEqual(len(seq), len(expected))
+            self.assertEqual([seq[i] for i in range(len(seq))], expected)
+            with self.assertRaises(IndexError):
+                seq[len(seq)]
+
     def test_binary_search_tree(self):
         bst = BinarySearchTree()
         bst.insert(5, "Five")
@@ -333,6 +1833,195 @@ class DataStructuresTest(unittest.TestCase):
         self.assertEqual(bst.search(5), "Five")
         self.assertEqual(bst.inorder_traversal(), [(3, "Three"), (5, "Five"), (7, "Seven")])
 
+        # Sorted inserts build a chain deeper than the recursion limit
+        chain = BinarySearchTree()
+        for key in range(5000):
+            chain.insert(key, key)
+        chain.insert(2500, "updated")
+        self.assertEqual(chain.search(4999), 4999)
+        self.assertEqual(chain.search(2500), "updated")
+        self.assertEqual(len(chain.inorder_traversal()), 5000)
+
+    def test_tree_iteration(self):
+        bst = BinarySearchTree()
+        for key in (5, 3, 8, 1, 4, 9):
+            bst.insert(key, key * 10)
+
+        self.assertEqual([key for key, _ in bst.iter_preorder()], [5, 3, 1, 4, 8, 9])
+        self.assertEqual([key for key, _ in bst.iter_postorder()], [1, 4, 3, 9, 8, 5])
+        self.assertEqual([key for key, _ in bst.iter_level_order()], [5, 3, 8, 1, 4, 9])
+        self.assertEqual([key for key, _ in reversed(bst)], [9, 8, 5, 4, 3, 1])
+        self.assertEqual(list(islice(bst, 2)), [(1, 10), (3, 30)])
+
+        # A degenerate tree deeper than the recursion limit still streams
+        deep = BinarySearchTree()
+        node = deep.root = TreeNode(0, None)
+        for key in range(1, 5000):
+            node.right = TreeNode(key, None)
+            node = node.right
+        self.assertEqual(sum(1 for _ in deep), 5000)
+        self.assertEqual(next(iter(reversed(deep)))[0], 4999)
+
+    def test_bulk_load(self):
+        tree = BinarySearchTree.from_sorted((key, str(key)) for key in range(1023))
+        self.assertEqual(tree.inorder_traversal(), [(key, str(key)) for key in range(1023)])
+        self.assertEqual(tree.search(512), "512")
+
+        shuffled = AVLTree.from_iterable([(3, "c"), (1, "a"), (2, "b"), (1, "A")])
+        self.assertEqual(shuffled.inorder_traversal(), [(1, "A"), (2, "b"), (3, "c")])
+        self.assertEqual(shuffled.height(), 2)
+
+        evens = BinarySearchTree.from_sorted((key, "even") for key in range(0, 10, 2))
+        odds = BinarySearchTree.from_sorted((key, "odd") for key in range(1, 10, 3))
+        merged = evens.merge(odds)
+        self.assertEqual([key for key, _ in merged], [0, 1, 2, 4, 6, 7, 8])
+        self.assertEqual(merged.search(4), "odd")
+
+        # Unsorted input is rejected rather than building an invalid tree
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([(1, "a"), (3, "c"), (2, "b")])
+        repeated = AVLTree.from_sorted([(1, "a"), (1, "b"), (2, "c")])
+        self.assertEqual(repeated.inorder_traversal(), [(1, "b"), (2, "c")])
+
+    def test_serialization(self):
+        import io
+        import os
+        import tempfile
+
+        tree = AVLTree.from_sorted((key, {"id": key}) for key in range(300))
+        buffer = io.BytesIO()
+        tree.dump(buffer)
+        buffer.seek(0)
+        restored = AVLTree.load(buffer)
+        self.assertEqual(restored.inorder_traversal(), tree.inorder_traversal())
+        self.assertEqual(restored.height(), tree.height())
+
+        # A degenerate tree reloads without recursion, through mmap on a real file
+        deep = BinarySearchTree()
+        node = deep.root = TreeNode(0, "0")
+        for key in range(1, 5000):
+            node.right = TreeNode(key, str(key))
+            node = node.right
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tree.bin")
+            with open(path, "wb") as fp:
+                deep.dump(fp)
+            with open(path, "rb") as fp:
+                reloaded = BinarySearchTree.load(fp)
+        self.assertEqual(reloaded.search(4999), "4999")
+
+        # Each field type round-trips with its exact type; others fall back to pickle
+        values = [None, True, False, -1, 300, -70_000, 2**40, 2**70, 1.5, "", "h\u00e9llo",
+                  "x" * 300, b"\x00\xff", b"y" * 300, (1, "a"), {"id": 1}]
+        ll = LinkedList()
+        for value in reversed(values):
+            ll.insert_front(value)
+        buffer = io.BytesIO()
+        ll.dump(buffer)
+        buffer.seek(0)
+        copy = list(LinkedList.load(buffer))
+        self.assertEqual(copy, values)
+        self.assertEqual([type(value) for value in copy], [type(value) for value in values])
+        # An int key costs a tag byte plus its narrowest width, not a pickle
+        small = BinarySearchTree.from_sorted((key, None) for key in range(100))
+        buffer = io.BytesIO()
+        small.dump(buffer)
+        self.assertLessEqual(len(buffer.getvalue()), 12 + 100 * 4)
+
+        for cls in (LinkedList, IndexedLinkedList):
+            ll = cls()
+            for value in ("a", "b", "c"):
+                ll.insert_front(value)
+            buffer = io.BytesIO()
+            ll.dump(buffer)
+            buffer.seek(0)
+            copy = cls.load(buffer)
+            self.assertEqual(list(copy), ["c", "b", "a"])
+            self.assertEqual(len(copy), 3)
+            self.assertTrue(copy.search("b"))
+
+        with self.assertRaises(ValueError):
+            LinkedList.load(io.BytesIO(b"XXXX" + bytes(8)))
+        with self.assertRaises(ValueError):
+            LinkedList.load(io.BytesIO(b""))
+
+        # Several dumps in one file load back in order, mapped or read
+        ll = LinkedList()
+        ll.insert_front("x")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "both.bin")
+            with open(path, "wb") as fp:
+                ll.dump(fp)
+                tree.dump(fp)
+            with open(path, "rb") as fp:
+                data = fp.read()
+                for source in (fp, io.BytesIO(data)):
+                    source.seek(0)
+                    self.assertEqual(list(LinkedList.load(source)), ["x"])
+                    self.assertEqual(AVLTree.load(source).inorder_traversal(), tree.inorder_traversal())
+                    self.assertEqual(source.tell(), len(data))
+            tree_start = data.index(AVLTree._MAGIC)
+            with self.assertRaises(ValueError):
+                AVLTree.load(io.BytesIO(data[tree_start:len(data) - 3]))
+            with open(os.path.join(directory, "empty.bin"), "wb+") as fp:
+                with self.assertRaises(ValueError):
+                    BinarySearchTree.load(fp)
+
+    def test_concurrent_tree(self):
+        tree = ConcurrentBinarySearchTree()
+        for key in (5, 3, 8, 1, 4):
+            tree.insert(key, str(key))
+
+        snapshot = tree.snapshot()
+        tree.insert(6, "6")
+        tree.insert(3, "three")
+        self.assertTrue(tree.delete(5))
+        self.assertFalse(tree.delete(42))
+
+        # The snapshot still sees the tree exactly as it was
+        self.assertEqual(snapshot.inorder_traversal(),
+                         [(1, "1"), (3, "3"), (4, "4"), (5, "5"), (8, "8")])
+        self.assertEqual(tree.inorder_traversal(),
+                         [(1, "1"), (3, "three"), (4, "4"), (6, "6"), (8, "8")])
+        with self.assertRaises(TypeError):
+            snapshot.insert(9, "9")
+
+        # Snapshots iterated during concurrent inserts are always consistent
+        def writer():
+            for key in range(100, 600):
+                tree.insert(key, None)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while thread.is_alive():
+            keys = [key for key, _ in tree.snapshot()]
+            self.assertEqual(keys, sorted(keys))
+        thread.join()
+        self.assertEqual(len(tree.inorder_traversal()), 505)
+
+    def test_avl_tree(self):
+        tree = AVLTree()
+        for key in range(2000):
+            tree.insert(key, str(key))
+
+        self.assertLessEqual(tree.height(), 12)
+        self.assertEqual(tree.search(1234), "1234")
+
+        for key in range(0, 2000, 2):
+            self.assertTrue(tree.delete(key))
+        self.assertFalse(tree.delete(0))
+        self.assertIsNone(tree.search(1234))
+        self.assertEqual([key for key, _ in tree.inorder_traversal()], list(range(1, 2000, 2)))
+
+        def check_balance(node):
+            if node is None:
+                return 0
+            left, right = check_balance(node.left), check_balance(node.right)
+            self.assertLessEqual(abs(left - right), 1)
+            self.assertEqual(node.height, max(left, right) + 1)
+            return node.height
+        check_balance(tree.root)
+
     def test_union_set(self):
         set1 = UnionSet[int]()
         set1.add(1)
@@ -347,6 +2036,45 @@ class DataStructuresTest(unittest.TestCase):
         self.assertTrue(2 in union_set)
         self.assertTrue(3 in union_set)
 
+    def test_union_set_bulk_operations(self):
+        evens, odds, small = UnionSet(range(0, 20, 2)), UnionSet(range(1, 20, 2)), UnionSet([2, 3, 40])
+        self.assertEqual(set(evens.intersection(small)), {2})
+        self.assertEqual(set(small.difference(evens)), {3, 40})
+
+        merged = UnionSet[int]()
+        merged.update(evens, [99], odds)
+        self.assertEqual(len(merged), 21)
+        merged -= odds
+        merged &= UnionSet(range(10))
+        self.assertEqual(set(merged), {0, 2, 4, 6, 8})
+        merged |= small
+        merged ^= UnionSet([40, 41])
+        self.assertEqual(set(merged), {0, 2, 3, 4, 6, 8, 41})
+
+        self.assertEqual(len(UnionSet.union_all(evens, odds, small)), 21)
+        self.assertEqual(set(UnionSet.intersection_all(evens, small, UnionSet([2, 3]))), {2})
+        self.assertEqual(len(UnionSet.intersection_all()), 0)
+
+        # Unsized operands such as generators are accepted too
+        self.assertEqual(set(evens.intersection(n for n in range(5))), {0, 2, 4})
+        self.assertEqual(set(UnionSet.intersection_all(evens, (n for n in (4, 5)))), {4})
+        alone = UnionSet.intersection_all(small)
+        alone.add(7)
+        self.assertNotIn(7, small)
+
+        # Every binary and in-place operation takes lists and generators
+        for make in (list, lambda items: (item for item in items)):
+            self.assertEqual(set(small.union(make([3, 5]))), {2, 3, 5, 40})
+            self.assertEqual(set(small.intersection(make([3, 5]))), {3})
+            self.assertEqual(set(small.difference(make([3, 5]))), {2, 40})
+            self.assertEqual(set(small.symmetric_difference(make([3, 5]))), {2, 5, 40})
+            inplace = UnionSet([1, 2, 3])
+            inplace |= make([4])
+            inplace &= make([2, 3, 4])
+            inplace -= make([3])
+            inplace ^= make([4, 5])
+            self.assertEqual(set(inplace), {2, 5})
+
     def test_linked_list(self):
         ll = LinkedList()
         ll.insert_front(1)
@@ -356,10 +2084,86 @@ class DataStructuresTest(unittest.TestCase):
         self.assertTrue(ll.delete(1))
         self.assertFalse(ll.search(1))
 
+    def test_linked_list_iteration(self):
+        ll = LinkedList()
+        for value in range(5):
+            ll.insert_front(value)
+
+        self.assertEqual(len(ll), 5)
+        self.assertEqual(list(ll), [4, 3, 2, 1, 0])
+        self.assertIn(2, ll)
+        self.assertEqual(list(ll.window(1, 3)), [3, 2])
+        ll.delete(3)
+        self.assertEqual(len(ll), 4)
+
+    def test_indexed_linked_list(self):
+        ll = IndexedLinkedList()
+        for value in (1, 2, 1, 3):
+            ll.insert_back(value)
+
+        self.assertTrue(ll.search(3))
+        self.assertTrue(ll.delete(1))
+        self.assertEqual(list(ll), [2, 1, 3])
+        self.assertTrue(ll.search(1))
+        self.assertFalse(ll.delete(4))
+
+        # LRU usage: touch 2, then evict the least recently used value
+        self.assertTrue(ll.move_to_end(2))
+        self.assertEqual(ll.pop_front(), 1)
+        self.assertEqual(list(ll), [3, 2])
+        self.assertEqual(len(ll), 2)
+
+        # Duplicates: delete and move_to_end act on the occurrence nearest the head
+        dup = IndexedLinkedList()
+        back = dup.insert_back("x")
+        dup.insert_back("y")
+        dup.insert_front("x")
+        self.assertTrue(dup.delete("x"))
+        self.assertIs(dup.head, back)
+        newer = dup.insert_back("x")
+        self.assertTrue(dup.move_to_end("x"))
+        self.assertEqual(list(dup), ["y", "x", "x"])
+        self.assertIs(dup.head.next, newer)
+        self.assertTrue(dup.delete("x"))
+        self.assertEqual(list(dup), ["y", "x"])
+        self.assertIsNot(dup.tail, newer)
+
+        # A removed node is rejected without touching the list
+        node = ll.insert_back(4)
+        self.assertEqual(ll.remove_node(node), 4)
+        with self.assertRaises(ValueError):
+            ll.remove_node(node)
+        self.assertEqual(list(ll), [3, 2])
+        self.assertEqual(len(ll), 2)
+
     def test_person(self):
         person = Person("Alice", 30, "123 Main St")
         self.assertEqual(str(person), "Alice (Age: 30, Address: 123 Main St)")
 
+    def test_person_table(self):
+        import io
+
+        source = io.StringIO("name,age,address\n"
+                             "Alice,30,123 Main St\n"
+                             "Bob,25,9 Side Rd\n"
+                             "Alice,41,9 Side Rd\n")
+        table = PersonTable.from_csv(source)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(str(table[0]), "Alice (Age: 30, Address: 123 Main St)")
+        self.assertIsInstance(table[-1], Person)
+        self.assertIs(table.addresses[1], table.addresses[2])
+
+        self.assertEqual([p.age for p in table.find_by_name("Alice")], [30, 41])
+        self.assertEqual([p.name for p in table.filter_age(25, 35)], ["Bob", "Alice"])
+        self.assertEqual(table.count_age(40, 99), 1)
+
+        # Writes through a row view keep the indexes in step
+        table[1].name = "Alice"
+        table[1].age = 50
+        self.assertEqual([p.age for p in table.find_by_name("Alice")], [30, 50, 41])
+        self.assertEqual([p.age for p in table.filter_age(40, 99)], [41, 50])
+        self.assertEqual(table.find_by_name("Bob"), [])
+
 
 def main():
     # Demonstrate data structures
@@ -0,0 +1,362 @@
+# Disk-backed B+ Tree Implementation
+#
+# Keys and values live in fixed-size pages of a local file. Internal pages hold
+# separator keys and child page numbers, leaf pages hold the key/value pairs and
+# a link to the next leaf, and recently used pages are kept in an LRU cache.
+
+import os
+import pickle
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+NO_PAGE = -1
+
+
+class _Page:
+    """A class to represent one decoded page of the tree.
+
+    Keys are kept both as objects (for comparisons) and as pickled blobs, so a
+    page can be re-encoded without pickling its contents again.
+    """
+    __slots__ = ("page_id", "is_leaf", "keys", "key_blobs", "values", "children",
+                 "next_leaf", "nbytes", "dirty")
+
+    def __init__(self, page_id, is_leaf):
+        self.page_id = page_id
+        self.is_leaf = is_leaf
+        self.keys = []
+        self.key_blobs = []
+        self.values = []      # Pickled value blobs, leaves only
+        self.children = []   # Child page numbers, internal pages only
+        self.next_leaf = NO_PAGE
+        self.nbytes = BTree.PAGE_HEADER.size
+        self.dirty = True
+
+    def recount(self):
+        """Recompute the encoded size of the page."""
+        self.nbytes = BTree.PAGE_HEADER.size + sum(4 + len(blob) for blob in self.key_blobs)
+        if self.is_leaf:
+            self.nbytes += sum(4 + len(blob) for blob in self.values)
+        else:
+            self.nbytes += 8 * len(self.children)
+
+
+class BTree:
+    """A class to represent a B+ tree key/value index stored in a paged file."""
+
+    MAGIC = b"PLBTREE1"
+    META = struct.Struct("<8sIqqq")
+    PAGE_HEADER = struct.Struct("<BIq")
+    LENGTH = struct.Struct("<I")
+    CHILD = struct.Struct("<q")
+
+    def __init__(self, path, page_size=4096, cache_bytes=4 * 1024 * 1024):
+        """Open the index at path, creating it if it does not exist."""
+        self.path = path
+        self.page_reads = 0
+        self.page_writes = 0
+        self.cache_hits = 0
+        self._cache = OrderedDict()
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            magic, self.page_size, self.root_id, self.page_count, self.size = \
+                self.META.unpack(self._file.read(self.META.size))
+            if magic != self.MAGIC:
+                raise ValueError(f"{path} is not a B+ tree index.")
+        else:
+            self.page_size = page_size
+            self.page_count = 1  # Page 0 holds the metadata
+            self.size = 0
+        self.cache_pages = max(cache_bytes // self.page_size, 8)
+        if not exists:
+            self.root_id = self._new_page(is_leaf=True).page_id
+
+    # Context manager support so the file is always flushed and closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """Return the number of keys in the index."""
+        return self.size
+
+    def __iter__(self):
+        """Yield (key, value) pairs in ascending key order by walking the leaves."""
+        return self.range(None, None)
+
+    # Page cache
+
+    def _new_page(self, is_leaf):
+        page = _Page(self.page_count, is_leaf)
+        self.page_count += 1
+        self._cache_put(page)
+        return page
+
+    def _cache_put(self, page):
+        self._cache[page.page_id] = page
+        while len(self._cache) > self.cache_pages:
+            _, evicted = self._cache.popitem(last=False)
+            if evicted.dirty:
+                self._write_page(evicted)
+
+    def _touch(self, page):
+        """Mark a modified page dirty, returning it to the cache if it was evicted."""
+        page.dirty = True
+        if page.page_id in self._cache:
+            self._cache.move_to_end(page.page_id)
+        else:
+            self._cache_put(page)
+
+    def _get_page(self, page_id):
+        page = self._cache.get(page_id)
+        if page is not None:
+            self._cache.move_to_end(page_id)
+            self.cache_hits += 1
+            return page
+        self._file.seek(page_id * self.page_size)
+        page = self._decode(page_id, self._file.read(self.page_size))
+        self.page_reads += 1
+        self._cache_put(page)
+        return page
+
+    def _write_page(self, page):
+        self._file.seek(page.page_id * self.page_size)
+        self._file.write(self._encode(page))
+        page.dirty = False
+        self.page_writes += 1
+
+    def flush(self):
+        """Write every dirty page and the metadata page to disk."""
+        for page in self._cache.values():
+            if page.dirty:
+                self._write_page(page)
+        self._file.seek(0)
+        self._file.write(self.META.pack(self.MAGIC, self.page_size, self.root_id,
+                                        self.page_count, self.size).ljust(self.page_size, b"\0"))
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the underlying file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    # Page encoding
+
+    def _encode(self, page):
+        parts = [self.PAGE_HEADER.pack(page.is_leaf, len(page.keys), page.next_leaf)]
+        if page.is_leaf:
+            for key_blob, value_blob in zip(page.key_blobs, page.values):
+                parts += [self.LENGTH.pack(len(key_blob)), key_blob,
+                          self.LENGTH.pack(len(value_blob)), value_blob]
+        else:
+            parts += [self.CHILD.pack(child) for child in page.children]
+            for key_blob in page.key_blobs:
+                parts += [self.LENGTH.pack(len(key_blob)), key_blob]
+        return b"".join(parts).ljust(self.page_size, b"\0")
+
+    def _decode(self, page_id, data):
+        is_leaf, count, next_leaf = self.PAGE_HEADER.unpack_from(data, 0)
+        page = _Page(page_id, bool(is_leaf))
+        page.next_leaf = next_leaf
+        offset = self.PAGE_HEADER.size
+
+        def read_blob():
+            nonlocal offset
+            (length,) = self.LENGTH.unpack_from(data, offset)
+            offset += 4 + length
+            return data[offset - length:offset]
+
+        if not page.is_leaf:
+            page.children = [self.CHILD.unpack_from(data, offset + 8 * i)[0] for i in range(count + 1)]
+            offset += 8 * (count + 1)
+        for _ in range(count):
+            page.key_blobs.append(read_blob())
+            if page.is_leaf:
+                page.values.append(read_blob())
+        page.keys = [pickle.loads(blob) for blob in page.key_blobs]
+        page.nbytes = offset
+        page.dirty = False
+        return page
+
+    # Operations
+
+    def _find_leaf(self, key):
+        """Return the leaf that may hold key and the internal pages above it."""
+        path = []
+        page = self._get_page(self.root_id)
+        while not page.is_leaf:
+            path.append(page)
+            page = self._get_page(page.children[bisect_right(page.keys, key)])
+        return page, path
+
+    def search(self, key):
+        """Return the value stored under key, or None if it is absent."""
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return pickle.loads(leaf.values[index])
+        return None
+
+    def insert(self, key, value):
+        """Insert a key/value pair, replacing the value if the key exists."""
+        key_blob = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        value_blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        # Splits halve pages by bytes, so any entry up to half a page always fits
+        entry_bytes = max(8 + len(key_blob) + len(value_blob), 12 + len(key_blob))
+        if self.PAGE_HEADER.size + 8 + entry_bytes > self.page_size // 2:
+            raise ValueError("Entry is too large for the page size.")
+
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.nbytes += len(value_blob) - len(leaf.values[index])
+            leaf.values[index] = value_blob
+        else:
+            leaf.keys.insert(index, key)
+            leaf.key_blobs.insert(index, key_blob)
+            leaf.values.insert(index, value_blob)
+            leaf.nbytes += 8 + len(key_blob) + len(value_blob)
+            self.size += 1
+        self._touch(leaf)
+
+        page = leaf
+        while page.nbytes > self.page_size:
+            separator_key, separator_blob, sibling = self._split(page)
+            if path:
+                parent = path.pop()
+            else:
+                parent = self._new_page(is_leaf=False)
+                parent.children.append(page.page_id)
+                self.root_id = parent.page_id
+            position = bisect_right(parent.keys, separator_key)
+            parent.keys.insert(position, separator_key)
+            parent.key_blobs.insert(position, separator_blob)
+            parent.children.insert(position + 1, sibling.page_id)
+            parent.recount()
+            self._touch(parent)
+            page = parent
+
+    def _split(self, page):
+        """Move the upper half of an overfull page into a new sibling page."""
+        sibling = self._new_page(page.is_leaf)
+        if page.is_leaf:
+            sizes = [8 + len(k) + len(v) for k, v in zip(page.key_blobs, page.values)]
+        else:
+            sizes = [12 + len(k) for k in page.key_blobs]
+        mid, running = 0, 0
+        while mid < len(sizes) - 1 and running + sizes[mid] <= sum(sizes) // 2:
+            running += sizes[mid]
+            mid += 1
+        mid = max(mid, 1)
+        if page.is_leaf:
+            sibling.keys, page.keys = page.keys[mid:], page.keys[:mid]
+            sibling.key_blobs, page.key_blobs = page.key_blobs[mid:], page.key_blobs[:mid]
+            sibling.values, page.values = page.values[mid:], page.values[:mid]
+            sibling.next_leaf, page.next_leaf = page.next_leaf, sibling.page_id
+            separator_key, separator_blob = sibling.keys[0], sibling.key_blobs[0]
+        else:
+            # The middle key moves up rather than being copied
+            separator_key, separator_blob = page.keys[mid], page.key_blobs[mid]
+            sibling.keys, page.keys = page.keys[mid + 1:], page.keys[:mid]
+            sibling.key_blobs, page.key_blobs = page.key_blobs[mid + 1:], page.key_blobs[:mid]
+            sibling.children, page.children = page.children[mid + 1:], page.children[:mid + 1]
+        page.recount()
+        sibling.recount()
+        self._touch(page)
+        return separator_key, separator_blob, sibling
+
+    def range(self, lo, hi):
+        """Yield (key, value) pairs with lo <= key <= hi by walking linked leaves.
+
+        Pass None for either bound to leave that side open.
+        """
+        if lo is None:
+            leaf = self._get_page(self.root_id)
+            while not leaf.is_leaf:
+                leaf = self._get_page(leaf.children[0])
+            index = 0
+        else:
+            leaf, _ = self._find_leaf(lo)
+            index = bisect_left(leaf.keys, lo)
+        while True:
+            keys, values = leaf.keys, leaf.values
+            for i in range(index, len(keys)):
+                if hi is not None and keys[i] > hi:
+                    return
+                yield keys[i], pickle.loads(values[i])
+            if leaf.next_leaf == NO_PAGE:
+                return
+            leaf = self._get_page(leaf.next_leaf)
+            index = 0
+
+    def inorder_traversal(self):
+        """Return every (key, value) pair in ascending key order."""
+        return list(self)
+
+
+# Test Cases
+def test_btree():
+    import tempfile
+
+    print("\n# TESTING DISK-BACKED B+ TREE")
+    path = os.path.join(tempfile.mkdtemp(), "index.btree")
+
+    print("Inserting 5,000 keys in shuffled order into 512-byte pages")
+    with BTree(path, page_size=512, cache_bytes=8 * 512) as tree:
+        for key in sorted(range(5000), key=lambda k: (k * 7919) % 5000):
+            tree.insert(key, f"Value{key}")
+        tree.insert(42, "Updated")
+        print("Number of keys:", len(tree))
+        print("Search key 1234:", tree.search(1234))
+        print("Search key 9999:", tree.search(9999))
+        print("Range [10, 14]:", list(tree.range(10, 14)))
+
+    print("Reopening the index from disk")
+    with BTree(path) as tree:
+        tree.page_reads = 0
+        print("Search key 42:", tree.search(42))
+        print("Page reads for one cold lookup:", tree.page_reads)
+        print("First three pairs:", tree.inorder_traversal()[:3])
+    os.remove(path)
+
+
+def benchmark_btree(size=200_000, page_size=4096, cache_bytes=1024 * 1024):
+    """Measure bulk insert throughput and page reads per lookup."""
+    import random
+    import tempfile
+    import time
+
+    print("\n# BENCHMARK: DISK-BACKED B+ TREE")
+    path = os.path.join(tempfile.mkdtemp(), "bench.btree")
+    keys = random.sample(range(size * 10), size)
+    with BTree(path, page_size=page_size, cache_bytes=cache_bytes) as tree:
+        start = time.perf_counter()
+        for key in keys:
+            tree.insert(key, key)
+        tree.flush()
+        elapsed = time.perf_counter() - start
+        print(f"Inserted {size} keys in {elapsed:.2f}s ({size / elapsed:,.0f} inserts/s), "
+              f"{tree.page_count} pages")
+
+        tree.page_reads = tree.cache_hits = 0
+        lookups = keys[:10_000]
+        start = time.perf_counter()
+        for key in lookups:
+            tree.search(key)
+        elapsed = time.perf_counter() - start
+        touched = (tree.page_reads + tree.cache_hits) / len(lookups)
+        print(f"{len(lookups)} lookups in {elapsed:.2f}s, {touched:.1f} pages touched and "
+              f"{tree.page_reads / len(lookups):.2f} disk reads per lookup")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    test_btree()
+    benchmark_btree(size=50_000)
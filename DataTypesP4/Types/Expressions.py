@@ -1,4 +1,11 @@
 #Practical Five: Expressions
+import math
+import numbers
+import operator
+import re
+from array import array
+from functools import lru_cache
+from itertools import repeat
 
 # ---------------------------------
 # Operator Precedence
@@ -42,23 +49,83 @@ def demonstrate_conditionals():
 # Operator Overloading
 # ---------------------------------
 class Vector:
-    """A simple class to demonstrate operator overloading."""
+    """A simple class to demonstrate operator overloading.
+
+    The in-place operators mutate the vector, so a Vector used as a dict key
+    or set member must not be updated while it is stored there.
+    """
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
+    # Unknown operands return NotImplemented so that types such as VectorArray
+    # get the chance to handle them through their reflected operators.
     def __add__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
         return Vector(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
         return Vector(self.x - other.x, self.y - other.y)
 
     def __mul__(self, scalar):
+        if not isinstance(scalar, numbers.Number):
+            return NotImplemented
         return Vector(self.x * scalar, self.y * scalar)
 
+    __rmul__ = __mul__
+
     def __truediv__(self, scalar):
+        if not isinstance(scalar, numbers.Number):
+            return NotImplemented
         return Vector(self.x / scalar, self.y / scalar)
 
+    def __iadd__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, numbers.Number):
+            return NotImplemented
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __itruediv__(self, scalar):
+        if not isinstance(scalar, numbers.Number):
+            return NotImplemented
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def axpy(self, a, x):
+        """Update this vector in place to a * x + self without a temporary."""
+        self.x += a * x.x
+        self.y += a * x.y
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __repr__(self):
         return f"Vector({self.x}, {self.y})"
 
@@ -74,6 +141,223 @@ def demonstrate_operator_overloading():
     print("v1 - v2 =", v1 - v2)
     print("v1 * 3 =", v1 * 3)
     print("v2 / 2 =", v2 / 2)
+    print("3 * v1 =", 3 * v1)  # Reflected multiplication
+    print("v1 == Vector(2, 3) =", v1 == Vector(2, 3))  # Should output True
+
+    v3 = Vector(1, 1)
+    v3 += v1  # Updates v3 in place instead of allocating a new Vector
+    v3.axpy(2, v2)  # v3 = 2 * v2 + v3
+    print("Vector(1, 1) + v1 + 2 * v2 =", v3)  # Should output Vector(11, 14)
+
+def benchmark_vector_operations(iterations=1_000_000):
+    """Compare bytes per instance and the cost of allocating vs in-place updates."""
+    import time
+    import tracemalloc
+
+    class DictVector:
+        """The original Vector layout, with a per-instance __dict__."""
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    print(f"\n# Benchmark: Vector operations ({iterations:,} iterations)")
+    for name, cls in (("__dict__ Vector", DictVector), ("__slots__ Vector", Vector)):
+        tracemalloc.start()
+        instances = [cls(0.0, 0.0) for _ in range(100_000)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        print(f"{name:<18} {current / 100_000:6.1f} bytes per instance")
+
+    step = Vector(1.0, 2.0)
+
+    def add(v):
+        return v + step
+
+    def add_in_place(v):
+        v += step
+        return v
+
+    def fused(v):
+        return v.axpy(2.0, step)
+
+    samples = 10_000
+    for name, update in (("v = v + w", add), ("v += w", add_in_place), ("v.axpy(2, w)", fused)):
+        v = Vector(0.0, 0.0)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            v = update(v)
+        elapsed = time.perf_counter() - start
+
+        # The traced peak above the pre-op baseline is what one update asks the
+        # allocator for. Every update still creates new float objects, but
+        # CPython recycles those from its float free list, so only a new
+        # Vector shows up here.
+        tracemalloc.start()
+        allocated = 0
+        for _ in range(samples):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            v = update(v)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        print(f"{name:<18} {elapsed / iterations * 1e9:6.0f} ns/op, "
+              f"{allocated / samples:5.1f} bytes allocated per op")
+
+# ---------------------------------
+# Batched Vectors
+# ---------------------------------
+class VectorView(Vector):
+    """A Vector that reads and writes one row of a VectorArray in place."""
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, vector_array, index):
+        self._array = vector_array
+        self._index = index
+
+    @property
+    def x(self):
+        return self._array.xs[self._index]
+
+    @x.setter
+    def x(self, value):
+        self._array.xs[self._index] = value
+
+    @property
+    def y(self):
+        return self._array.ys[self._index]
+
+    @y.setter
+    def y(self, value):
+        self._array.ys[self._index] = value
+
+class VectorArray:
+    """A class to represent many 2D vectors as two contiguous float columns.
+
+    Operators work elementwise against another VectorArray of the same length,
+    or broadcast a single Vector or scalar, so batch math runs through
+    map/operator in C instead of allocating one Vector per result.
+    """
+    def __init__(self, xs=(), ys=()):
+        self.xs = array("d", xs)
+        self.ys = array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("x and y columns must have the same length.")
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Build a VectorArray from an iterable of Vectors."""
+        result = cls()
+        for vector in vectors:
+            result.append(vector)
+        return result
+
+    def append(self, vector):
+        """Add a vector to the end of the array."""
+        self.xs.append(vector.x)
+        self.ys.append(vector.y)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray(self.xs[index], self.ys[index])
+        if index < 0:
+            index += len(self.xs)
+        if not 0 <= index < len(self.xs):
+            raise IndexError("VectorArray index out of range")
+        return VectorView(self, index)
+
+    def __setitem__(self, index, vector):
+        self.xs[index] = vector.x
+        self.ys[index] = vector.y
+
+    def __iter__(self):
+        for index in range(len(self.xs)):
+            yield VectorView(self, index)
+
+    def _columns(self, other):
+        """Return the x and y operands of other, repeated if it is a Vector or scalar."""
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray lengths differ.")
+            return other.xs, other.ys
+        if isinstance(other, Vector):
+            return repeat(other.x), repeat(other.y)
+        return repeat(other), repeat(other)
+
+    def _apply(self, op, other):
+        other_xs, other_ys = self._columns(other)
+        return VectorArray(map(op, self.xs, other_xs), map(op, self.ys, other_ys))
+
+    def __add__(self, other):
+        return self._apply(operator.add, other)
+
+    def __sub__(self, other):
+        return self._apply(operator.sub, other)
+
+    def __mul__(self, other):
+        return self._apply(operator.mul, other)
+
+    def __truediv__(self, other):
+        return self._apply(operator.truediv, other)
+
+    def __rsub__(self, other):
+        other_xs, other_ys = self._columns(other)
+        return VectorArray(map(operator.sub, other_xs, self.xs), map(operator.sub, other_ys, self.ys))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def sum(self):
+        """Return the sum of all vectors as a single Vector."""
+        return Vector(math.fsum(self.xs), math.fsum(self.ys))
+
+    def dot(self, other):
+        """Return the row-wise dot products with another VectorArray or a Vector."""
+        other_xs, other_ys = self._columns(other)
+        return array("d", map(operator.add, map(operator.mul, self.xs, other_xs),
+                              map(operator.mul, self.ys, other_ys)))
+
+    def norm(self):
+        """Return the length of every vector."""
+        return array("d", map(math.hypot, self.xs, self.ys))
+
+    def __repr__(self):
+        return f"VectorArray({len(self)} vectors)"
+
+def demonstrate_vector_array():
+    """Demonstrate batched vector math over contiguous columns."""
+    print("\n# Batched Vectors")
+    points = VectorArray([1, 2, 3], [4, 5, 6])
+    print("points + Vector(1, 1) =", list(points + Vector(1, 1)))
+    print("points * 2 =", list(points * 2))
+    print("Vector(10, 10) - points =", list(Vector(10, 10) - points))  # Broadcasts from the left too
+    print("sum =", points.sum())  # Should output Vector(6.0, 15.0)
+    print("dot with Vector(1, 0) =", list(points.dot(Vector(1, 0))))  # Should output [1.0, 2.0, 3.0]
+    print("norm of Vector(3, 4) row =", VectorArray([3], [4]).norm()[0])  # Should output 5.0
+
+    view = points[1]
+    view.x = 20  # Writes through to the column
+    print("points[1] after write =", view, "column xs =", list(points.xs))
+
+def benchmark_vector_array(size=1_000_000):
+    """Compare a list of Vectors against a VectorArray for a * p + q."""
+    import time
+
+    print(f"\n# Benchmark: list of Vector vs VectorArray ({size:,} points)")
+    vectors = [Vector(float(i), float(i + 1)) for i in range(size)]
+    offset = Vector(1.0, 2.0)
+    start = time.perf_counter()
+    [v * 2.0 + offset for v in vectors]
+    objects = time.perf_counter() - start
+
+    batch = VectorArray.from_vectors(vectors)
+    start = time.perf_counter()
+    batch * 2.0 + offset
+    columns = time.perf_counter() - start
+    print(f"list of Vector {objects:.3f}s, VectorArray {columns:.3f}s ({objects / columns:.1f}x)")
 
 # ---------------------------------
 # Type Coercion
@@ -95,6 +379,314 @@ def demonstrate_type_coercion():
     mixed_type_result = "Number: " + str(42)
     print(f"""Mixed type concatenation (explicit conversion): {mixed_type_result}""")
 
+# ---------------------------------
+# Compiled Rule Expressions
+# ---------------------------------
+# Arithmetic, comparison and boolean expressions over named variables, e.g.
+# "age >= 18 and (score * 1.5 + bonus) > 100". Precedence and coercion follow
+# Python, lowest to highest: or, and, not, comparisons, + -, * / // %,
+# unary - +, **. Each source string is parsed once into nested closures.
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+\.\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?|\d+(?:[eE][-+]?\d+)?)
+      | (?P<string>'[^']*'|"[^"]*")
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<op>\*\*|//|<=|>=|==|!=|[-+*/%<>(),])
+    )""", re.VERBOSE)
+
+_BINARY = {
+    "+": (50, operator.add), "-": (50, operator.sub),
+    "*": (60, operator.mul), "/": (60, operator.truediv),
+    "//": (60, operator.floordiv), "%": (60, operator.mod),
+    "**": (80, operator.pow),
+}
+_COMPARISONS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+}
+_FUNCTIONS = {
+    "int": int, "float": float, "str": str, "bool": bool,
+    "abs": abs, "min": min, "max": max, "round": round,
+}
+_KEYWORDS = {"True": True, "False": False}
+_OR, _AND, _NOT, _COMPARE, _UNARY = 10, 20, 30, 40, 70
+
+def _tokenize(source):
+    """Split an expression into (kind, text) tokens, ending with ("end", "")."""
+    tokens, position = [], 0
+    source = source.rstrip()
+    while position < len(source):
+        match = _TOKEN.match(source, position)
+        if not match:
+            position = len(source) - len(source[position:].lstrip())
+            raise ValueError(f"Unexpected character {source[position]!r} at position {position}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    tokens.append(("end", ""))
+    return tokens
+
+class _Const:
+    """A folded sub-expression whose value is known at compile time."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+def _runtime(node):
+    """Return a closure that evaluates a compiled node against a variable mapping."""
+    if isinstance(node, _Const):
+        value = node.value
+        return lambda env: value
+    return node
+
+# Limits on what constant folding may build, as in CPython's AST optimizer, so
+# a rule such as "x == 0 or 7 ** 7 ** 9" compiles instantly and the expensive
+# branch is only ever computed if short-circuiting reaches it.
+_MAX_FOLDED_INT_BITS = 128
+_MAX_FOLDED_STR_SIZE = 4096
+
+def _is_cheap(function, values):
+    """Return False if folding function over values could build a huge result."""
+    if function is operator.pow and len(values) == 2:
+        base, exponent = values
+        if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+            return base.bit_length() * exponent <= _MAX_FOLDED_INT_BITS
+    elif function is operator.mul and len(values) == 2:
+        left, right = values
+        if isinstance(left, int) and isinstance(right, int):
+            return left.bit_length() + right.bit_length() <= _MAX_FOLDED_INT_BITS
+        if isinstance(right, (str, bytes)):
+            left, right = right, left
+        if isinstance(left, (str, bytes)) and isinstance(right, int):
+            return len(left) * right <= _MAX_FOLDED_STR_SIZE
+    elif function is operator.mod and values and isinstance(values[0], (str, bytes)):
+        return False  # printf-style formatting can pad to any width
+    return True
+
+def _fold(function, operands):
+    """Evaluate function at compile time if every operand is constant.
+
+    Returns None when folding is not possible, would raise, or could build a
+    huge value, so errors such as division by zero still surface at
+    evaluation time and expensive work only happens if it is reached.
+    """
+    if all(isinstance(operand, _Const) for operand in operands):
+        values = [operand.value for operand in operands]
+        if not _is_cheap(function, values):
+            return None
+        try:
+            return _Const(function(*values))
+        except Exception:
+            return None
+    return None
+
+class _Parser:
+    """A Pratt parser that compiles tokens directly into closures."""
+
+    def __init__(self, source):
+        self.tokens = _tokenize(source)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position]
+
+    def advance(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def expect(self, text):
+        kind, value = self.advance()
+        if value != text:
+            raise ValueError(f"Expected {text!r} but found {value or 'end of expression'!r}")
+
+    def binding_power(self, token):
+        kind, text = token
+        if kind == "name":
+            return _OR if text == "or" else _AND if text == "and" else 0
+        if kind == "op":
+            if text in _BINARY:
+                return _BINARY[text][0]
+            if text in _COMPARISONS:
+                return _COMPARE
+        return 0
+
+    def parse(self):
+        node = self.expression(0)
+        if self.peek()[0] != "end":
+            raise ValueError(f"Unexpected {self.peek()[1]!r} after expression")
+        return node
+
+    def expression(self, right_binding):
+        left = self.prefix(self.advance(), right_binding)
+        while self.binding_power(self.peek()) > right_binding:
+            left = self.infix(left, self.advance())
+        return left
+
+    def prefix(self, token, right_binding):
+        kind, text = token
+        if kind == "number":
+            return _Const(float(text) if any(c in text for c in ".eE") else int(text))
+        if kind == "string":
+            return _Const(text[1:-1])
+        if kind == "op" and text == "(":
+            node = self.expression(0)
+            self.expect(")")
+            return node
+        if kind == "op" and text in ("-", "+"):
+            function = operator.neg if text == "-" else operator.pos
+            return self.unary(function, self.expression(_UNARY))
+        if kind == "name":
+            if text == "not":
+                if right_binding > _NOT:
+                    raise ValueError("'not' must be parenthesized here")
+                return self.unary(operator.not_, self.expression(_NOT))
+            if text in _KEYWORDS:
+                return _Const(_KEYWORDS[text])
+            if self.peek() == ("op", "("):
+                return self.call(text)
+            if text in ("and", "or"):
+                raise ValueError(f"Unexpected {text!r}")
+            return operator.itemgetter(text)
+        raise ValueError(f"Unexpected {text or 'end of expression'!r}")
+
+    def unary(self, function, operand):
+        folded = _fold(function, [operand])
+        if folded is not None:
+            return folded
+        operand = _runtime(operand)
+        return lambda env: function(operand(env))
+
+    def call(self, name):
+        if name not in _FUNCTIONS:
+            raise ValueError(f"Unknown function {name!r}")
+        function = _FUNCTIONS[name]
+        self.expect("(")
+        arguments = []
+        if self.peek() != ("op", ")"):
+            arguments.append(self.expression(0))
+            while self.peek() == ("op", ","):
+                self.advance()
+                arguments.append(self.expression(0))
+        self.expect(")")
+        folded = _fold(function, arguments)
+        if folded is not None:
+            return folded
+        arguments = [_runtime(argument) for argument in arguments]
+        return lambda env: function(*[argument(env) for argument in arguments])
+
+    def infix(self, left, token):
+        kind, text = token
+        if text == "and":
+            return self.logical(left, self.expression(_AND), is_and=True)
+        if text == "or":
+            return self.logical(left, self.expression(_OR), is_and=False)
+        if text in _COMPARISONS:
+            return self.comparison(left, text)
+        power, function = _BINARY[text]
+        # ** is right-associative, so its right operand may contain another **
+        right = self.expression(power - 1 if text == "**" else power)
+        folded = _fold(function, [left, right])
+        if folded is not None:
+            return folded
+        left = _runtime(left)
+        if isinstance(right, _Const):
+            constant = right.value
+            return lambda env: function(left(env), constant)
+        return lambda env: function(left(env), right(env))
+
+    def logical(self, left, right, is_and):
+        """Combine operands with Python's short-circuit and/or semantics."""
+        if isinstance(left, _Const):
+            return right if bool(left.value) == is_and else left
+        right = _runtime(right)
+        if is_and:
+            def evaluate(env):
+                value = left(env)
+                return right(env) if value else value
+        else:
+            def evaluate(env):
+                value = left(env)
+                return value if value else right(env)
+        return evaluate
+
+    def comparison(self, left, text):
+        """Compile a comparison chain such as a < b <= c, evaluating each operand once."""
+        functions, operands = [_COMPARISONS[text]], [left, self.expression(_COMPARE)]
+        while self.peek()[0] == "op" and self.peek()[1] in _COMPARISONS:
+            functions.append(_COMPARISONS[self.advance()[1]])
+            operands.append(self.expression(_COMPARE))
+
+        def chain(*values):
+            return all(f(a, b) for f, a, b in zip(functions, values, values[1:]))
+
+        folded = _fold(chain, operands)
+        if folded is not None:
+            return folded
+        if len(functions) == 1:
+            function, left, right = functions[0], _runtime(operands[0]), _runtime(operands[1])
+            return lambda env: function(left(env), right(env))
+        operands = [_runtime(operand) for operand in operands]
+
+        def evaluate(env):
+            previous = operands[0](env)
+            for function, operand in zip(functions, operands[1:]):
+                current = operand(env)
+                if not function(previous, current):
+                    return False
+                previous = current
+            return True
+        return evaluate
+
+@lru_cache(maxsize=1024)
+def compile_expression(source):
+    """Compile an expression once into a function of a variable mapping (cached by source)."""
+    return _runtime(_Parser(source).parse())
+
+def evaluate(source, variables=None):
+    """Evaluate an expression against a mapping of variable names to values."""
+    return compile_expression(source)(variables or {})
+
+def evaluate_many(source, rows):
+    """Evaluate one expression against every mapping in rows, compiling it once."""
+    compiled = compile_expression(source)
+    return [compiled(row) for row in rows]
+
+def demonstrate_compiled_expressions():
+    """Demonstrate compiling and evaluating rule expressions."""
+    print("\n# Compiled Rule Expressions")
+    print("10 + 5 * 2 =", evaluate("10 + 5 * 2"))  # Should output 20
+    print("(10 + 5) * 2 =", evaluate("(10 + 5) * 2"))  # Should output 30
+    print("10 > 5 and 3 < 7 or not 2 == 2 =", evaluate("10 > 5 and 3 < 7 or not 2 == 2"))  # True
+    print("10 + 3.5 =", evaluate("10 + 3.5"))  # int is coerced to float: 13.5
+    print("'Number: ' + str(42) =", evaluate("'Number: ' + str(42)"))
+    print("x < y and y > 0 with x=10, y=20:", evaluate("x < y and y > 0", {"x": 10, "y": 20}))
+    print("x > 0 or 1 / 0 short-circuits:", evaluate("x > 0 or 1 / 0", {"x": 1}))
+    print("x == 0 or 7 ** 7 ** 9 compiles instantly:", evaluate("x == 0 or 7 ** 7 ** 9", {"x": 0}))
+
+    rule = "age >= 18 and (score * 1.5 + bonus) > 100"
+    rows = [{"age": 17, "score": 90}, {"age": 30, "score": 60, "bonus": 15}]
+    print(f"{rule!r} over rows:", evaluate_many(rule, rows))  # Should output [False, True]
+
+def benchmark_compiled_expressions(rows=200_000):
+    """Compare evaluate_many against eval() of the source and of a code object."""
+    import random
+    import time
+
+    rule = "age >= 18 and (score * 1.5 + bonus) > 100 or vip == True"
+    data = [{"age": random.randint(10, 80), "score": random.random() * 100,
+             "bonus": random.randint(0, 30), "vip": random.random() < 0.1} for _ in range(rows)]
+    print(f"\n# Benchmark: rule evaluation ({rows:,} rows)")
+    code = compile(rule, "<rule>", "eval")
+    cases = (("eval(source)", lambda: [eval(rule, {}, row) for row in data[:rows // 10]], 10),
+             ("eval(code)", lambda: [eval(code, {}, row) for row in data], 1),
+             ("evaluate_many", lambda: evaluate_many(rule, data), 1))
+    for name, run, scale in cases:
+        start = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - start) * scale
+        print(f"{name:<14} {elapsed / rows * 1e9:7.0f} ns/row")
+
 # ---------------------------------
 # Main Function
 # ---------------------------------
@@ -103,7 +695,12 @@ def main():
     demonstrate_operator_precedence()
     demonstrate_conditionals()
     demonstrate_operator_overloading()
+    demonstrate_vector_array()
     demonstrate_type_coercion()
+    demonstrate_compiled_expressions()
+    benchmark_vector_operations()
+    benchmark_vector_array()
+    benchmark_compiled_expressions()
 
 if __name__ == "__main__":
     main()
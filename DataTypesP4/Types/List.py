@@ -1,5 +1,10 @@
+import random
+from itertools import islice
+
 class Node:
     """A class to represent a node in the singly linked list."""
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -8,71 +13,96 @@ class LinkedList:
     """A class to represent the entire singly linked list."""
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of nodes in constant time."""
+        return self.size
 
     def insert_at_beginning(self, data):
         """Insert a node at the beginning of the linked list."""
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if not self.tail:
+            self.tail = new_node
+        self.size += 1
 
     def insert_at_end(self, data):
-        """Insert a node at the end of the linked list."""
+        """Insert a node at the end of the linked list in constant time."""
         new_node = Node(data)
         if not self.head:
-            self.head = new_node
-            return
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self.size += 1
 
     def insert_at_position(self, position, data):
         """Insert a node at a specific position in the linked list."""
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds.")
         if position == 0:
             self.insert_at_beginning(data)
             return
+        if position == self.size:
+            self.insert_at_end(data)
+            return
 
         new_node = Node(data)
         current = self.head
         for _ in range(position - 1):
-            if not current:
-                raise IndexError("Position out of bounds.")
             current = current.next
 
         new_node.next = current.next
         current.next = new_node
+        self.size += 1
 
     def delete_at_beginning(self):
         """Delete a node from the beginning of the linked list."""
         if not self.head:
             raise IndexError("List is empty.")
         self.head = self.head.next
+        if not self.head:
+            self.tail = None
+        self.size -= 1
 
     def delete_at_end(self):
-        """Delete a node from the end of the linked list."""
+        """Delete a node from the end of the linked list.
+
+        A singly linked node has no back reference, so finding the new tail
+        still takes a walk; use DoublyLinkedList for O(1) removal at the end.
+        """
         if not self.head:
             raise IndexError("List is empty.")
         if not self.head.next:
-            self.head = None
+            self.head = self.tail = None
+            self.size = 0
             return
         current = self.head
-        while current.next and current.next.next:
+        while current.next is not self.tail:
             current = current.next
         current.next = None
+        self.tail = current
+        self.size -= 1
 
     def delete_at_position(self, position):
         """Delete a node from a specific position in the linked list."""
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds.")
         if position == 0:
             self.delete_at_beginning()
             return
 
         current = self.head
         for _ in range(position - 1):
-            if not current or not current.next:
-                raise IndexError("Position out of bounds.")
             current = current.next
 
+        if current.next is self.tail:
+            self.tail = current
         current.next = current.next.next
+        self.size -= 1
 
     def search(self, data):
         """Search for a node in the linked list by its value."""
@@ -85,12 +115,432 @@ class LinkedList:
             position += 1
         return -1
 
+    def __iter__(self):
+        """Yield node values lazily from the head, without building a list."""
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, data):
+        """Check membership, stopping at the first match."""
+        return self.search(data) != -1
+
+    def window(self, start, stop=None):
+        """Yield the values at positions start to stop - 1, like itertools.islice."""
+        return islice(self, start, stop)
+
     def traverse(self):
         """Traverse the linked list and return a list of node values."""
+        return list(self)
+
+class DoublyNode:
+    """A class to represent a node in the doubly linked list."""
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+class DoublyLinkedList:
+    """A class to represent a doubly linked list with head and tail references.
+
+    Insert methods return the new node, which can later be passed to remove()
+    to unlink it in constant time.
+    """
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of nodes in constant time."""
+        return self.size
+
+    def insert_at_beginning(self, data):
+        """Insert a node at the beginning of the list and return it."""
+        new_node = DoublyNode(data)
+        new_node.next = self.head
+        if self.head:
+            self.head.prev = new_node
+        else:
+            self.tail = new_node
+        self.head = new_node
+        self.size += 1
+        return new_node
+
+    def insert_at_end(self, data):
+        """Insert a node at the end of the list and return it."""
+        new_node = DoublyNode(data)
+        new_node.prev = self.tail
+        if self.tail:
+            self.tail.next = new_node
+        else:
+            self.head = new_node
+        self.tail = new_node
+        self.size += 1
+        return new_node
+
+    def insert_after(self, node, data):
+        """Insert a node directly after the given node and return it."""
+        if node is self.tail:
+            return self.insert_at_end(data)
+        new_node = DoublyNode(data)
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.size += 1
+        return new_node
+
+    def remove(self, node):
+        """Unlink the given node from the list in constant time.
+
+        A node that was already removed has no links and is not the head, so
+        passing it again raises ValueError instead of corrupting the list.
+        """
+        if node.prev is None and node is not self.head:
+            raise ValueError("Node is not in this list.")
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+        return node.data
+
+    def delete_at_beginning(self):
+        """Delete the first node and return its value."""
+        if not self.head:
+            raise IndexError("List is empty.")
+        return self.remove(self.head)
+
+    def delete_at_end(self):
+        """Delete the last node and return its value."""
+        if not self.tail:
+            raise IndexError("List is empty.")
+        return self.remove(self.tail)
+
+    def search(self, data):
+        """Search for a node in the list by its value."""
+        current = self.head
+        position = 0
+        while current:
+            if current.data == data:
+                return position
+            current = current.next
+            position += 1
+        return -1
+
+    def __iter__(self):
+        """Yield node values lazily from the head, without building a list."""
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, data):
+        """Check membership, stopping at the first match."""
+        return self.search(data) != -1
+
+    def window(self, start, stop=None):
+        """Yield the values at positions start to stop - 1, like itertools.islice."""
+        return islice(self, start, stop)
+
+    def traverse(self):
+        """Traverse the list and return a list of node values."""
+        return list(self)
+
+    def __reversed__(self):
+        """Yield node values from the tail back to the head."""
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+class SkipNode(Node):
+    """A linked list node with one forward reference per skip list level.
+
+    width[i] counts how many level-0 steps forward[i] jumps over, which is
+    what makes rank lookups logarithmic.
+    """
+    __slots__ = ("forward", "width")
+
+    def __init__(self, data, level):
+        self.forward = [None] * level
+        self.width = [1] * level
+        super().__init__(data)
+
+    @property
+    def next(self):
+        return self.forward[0]
+
+    @next.setter
+    def next(self, node):
+        self.forward[0] = node
+
+class SkipList:
+    """A class to represent an ordered set as a probabilistic skip list.
+
+    Search, insert, delete and rank lookups take O(log n) expected time.
+    """
+    MAX_LEVEL = 32
+    PROMOTION_PROBABILITY = 0.5
+
+    def __init__(self):
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of elements in constant time."""
+        return self.size
+
+    def __iter__(self):
+        """Yield elements in ascending order."""
+        current = self.head.next
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, data):
+        """Check membership in O(log n) expected time."""
+        return self.search(data) != -1
+
+    def __getitem__(self, rank):
+        """Return the element with the given 0-based rank."""
+        if not 0 <= rank < self.size:
+            raise IndexError("Rank out of bounds.")
+        current = self.head
+        remaining = rank + 1
+        for i in reversed(range(self.level)):
+            while current.forward[i] and current.width[i] <= remaining:
+                remaining -= current.width[i]
+                current = current.forward[i]
+        return current.data
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.PROMOTION_PROBABILITY:
+            level += 1
+        return level
+
+    def _find_predecessors(self, data):
+        """Return the last node before data on every level and its position."""
+        update = [self.head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        current = self.head
+        position = 0
+        for i in reversed(range(self.level)):
+            while current.forward[i] and current.forward[i].data < data:
+                position += current.width[i]
+                current = current.forward[i]
+            update[i] = current
+            positions[i] = position
+        return update, positions
+
+    def insert(self, data):
+        """Insert an element, returning False if it is already present."""
+        update, positions = self._find_predecessors(data)
+        candidate = update[0].forward[0]
+        if candidate and candidate.data == data:
+            return False
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                # Unused head levels point past the end of the list
+                self.head.forward[i] = None
+                self.head.width[i] = self.size + 1
+            self.level = level
+
+        new_node = SkipNode(data, level)
+        new_position = positions[0] + 1
+        for i in range(level):
+            predecessor = update[i]
+            new_node.forward[i] = predecessor.forward[i]
+            predecessor.forward[i] = new_node
+            new_node.width[i] = predecessor.width[i] - (new_position - positions[i]) + 1
+            predecessor.width[i] = new_position - positions[i]
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.size += 1
+        return True
+
+    def delete(self, data):
+        """Delete an element, returning False if it is not present."""
+        update, _ = self._find_predecessors(data)
+        target = update[0].forward[0]
+        if not target or target.data != data:
+            return False
+
+        for i in range(self.level):
+            if update[i].forward[i] is target:
+                update[i].width[i] += target.width[i] - 1
+                update[i].forward[i] = target.forward[i]
+            else:
+                update[i].width[i] -= 1
+        while self.level > 1 and not self.head.forward[self.level - 1]:
+            self.level -= 1
+        self.size -= 1
+        return True
+
+    def search(self, data):
+        """Search for an element and return its position, or -1 if absent."""
+        update, positions = self._find_predecessors(data)
+        candidate = update[0].forward[0]
+        if candidate and candidate.data == data:
+            return positions[0]
+        return -1
+
+    def rank(self, data):
+        """Return the number of elements strictly smaller than data."""
+        _, positions = self._find_predecessors(data)
+        return positions[0]
+
+    def range(self, lo, hi):
+        """Yield the elements x with lo <= x < hi in ascending order."""
+        update, _ = self._find_predecessors(lo)
+        current = update[0].forward[0]
+        while current and current.data < hi:
+            yield current.data
+            current = current.next
+
+    def traverse(self):
+        """Traverse the skip list and return a sorted list of its elements."""
+        return list(self)
+
+class UnrolledNode:
+    """A class to represent a node holding a small array of elements."""
+    __slots__ = ("elements", "next")
+
+    def __init__(self):
+        self.elements = []
+        self.next = None
+
+class UnrolledLinkedList:
+    """A class to represent a linked list whose nodes each store a block of elements.
+
+    Blocks are kept between half full and full, so traversal touches one node
+    per block instead of one per element.
+    """
+    def __init__(self, node_capacity=64):
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of elements in constant time."""
+        return self.size
+
+    def __iter__(self):
+        """Yield elements lazily, one block at a time."""
+        current = self.head
+        while current:
+            yield from current.elements
+            current = current.next
+
+    def __contains__(self, data):
+        """Check membership, stopping at the first matching block."""
+        return self.search(data) != -1
+
+    def _locate(self, position):
+        """Return the node holding position and the offset within it."""
+        current = self.head
+        while position > len(current.elements):
+            position -= len(current.elements)
+            current = current.next
+        return current, position
+
+    def insert_at_position(self, position, data):
+        """Insert an element at a specific position in the list."""
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of bounds.")
+        if not self.head:
+            self.head = self.tail = UnrolledNode()
+
+        if position == self.size:
+            node, offset = self.tail, len(self.tail.elements)
+        else:
+            node, offset = self._locate(position)
+        node.elements.insert(offset, data)
+        if len(node.elements) > self.node_capacity:
+            # Split the overflowing block, moving its upper half into a new node
+            new_node = UnrolledNode()
+            half = len(node.elements) // 2
+            new_node.elements = node.elements[half:]
+            del node.elements[half:]
+            new_node.next = node.next
+            node.next = new_node
+            if node is self.tail:
+                self.tail = new_node
+        self.size += 1
+
+    def insert_at_beginning(self, data):
+        """Insert an element at the beginning of the list."""
+        self.insert_at_position(0, data)
+
+    def insert_at_end(self, data):
+        """Insert an element at the end of the list."""
+        self.insert_at_position(self.size, data)
+
+    def delete_at_position(self, position):
+        """Delete the element at a specific position and return it."""
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of bounds.")
+
+        previous = None
+        node = self.head
+        while position >= len(node.elements):
+            position -= len(node.elements)
+            previous, node = node, node.next
+        data = node.elements.pop(position)
+        self.size -= 1
+
+        if not node.elements:
+            if previous:
+                previous.next = node.next
+            else:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = previous
+        elif node.next and len(node.elements) < self.node_capacity // 2:
+            # Refill the underfull block from its successor, merging when both fit
+            successor = node.next
+            if len(node.elements) + len(successor.elements) <= self.node_capacity:
+                node.elements.extend(successor.elements)
+                node.next = successor.next
+                if successor is self.tail:
+                    self.tail = node
+            else:
+                needed = self.node_capacity // 2 - len(node.elements)
+                node.elements.extend(successor.elements[:needed])
+                del successor.elements[:needed]
+        return data
+
+    def search(self, data):
+        """Search for an element and return its position, or -1 if absent."""
+        offset = 0
+        current = self.head
+        while current:
+            if data in current.elements:
+                return offset + current.elements.index(data)
+            offset += len(current.elements)
+            current = current.next
+        return -1
+
+    def traverse(self):
+        """Traverse the list and return a list of its elements."""
         elements = []
         current = self.head
         while current:
-            elements.append(current.data)
+            elements.extend(current.elements)
             current = current.next
         return elements
 
@@ -123,7 +573,172 @@ def test_linked_list():
     print("List before searching:", ll.traverse())
     print("Searching for 30:", ll.search(30))  # Should return position 0
     print("Searching for 50:", ll.search(50))  # Should return -1
+    print("Length of list:", len(ll))  # Should return 2
+
+    # Streaming iteration
+    print("Iterating lazily:", [value for value in ll])
+    print("Is 40 in the list?:", 40 in ll)
+    ll.insert_at_end(50)
+    print("Window of positions 1 to 2:", list(ll.window(1, 3)))  # Should return [40, 50]
+
+def test_doubly_linked_list():
+    print("\n# TESTING DOUBLY LINKED LIST")
+
+    dll = DoublyLinkedList()
+
+    # Inserting nodes and keeping a handle to one of them
+    print("Inserting 10, 20, 30 at the end and 5 at the beginning.")
+    dll.insert_at_end(10)
+    middle = dll.insert_at_end(20)
+    dll.insert_at_end(30)
+    dll.insert_at_beginning(5)
+    print("List after insertions:", dll.traverse())
+    print("Reverse traversal:", list(reversed(dll)))
+
+    # Removing by node handle
+    print("Removing the node holding 20 via its handle.")
+    dll.remove(middle)
+    print("List after removal:", dll.traverse())
+    try:
+        dll.remove(middle)
+    except ValueError as error:
+        print("Removing it again:", error)  # Should raise, list unchanged
+    print("List and length after the second removal:", dll.traverse(), len(dll))  # Should return [5, 10, 30] 3
+
+    # Deleting from both ends
+    print("Deleting from the beginning and the end.")
+    dll.delete_at_beginning()
+    dll.delete_at_end()
+    print("List after deletions:", dll.traverse())
+    print("Length of list:", len(dll))  # Should return 1
+
+def test_skip_list():
+    print("\n# TESTING SKIP LIST")
+
+    sl = SkipList()
+
+    # Inserting elements in arbitrary order
+    print("Inserting 30, 10, 50, 20, 40 and a duplicate 10.")
+    for value in [30, 10, 50, 20, 40]:
+        sl.insert(value)
+    print("Duplicate insert accepted?:", sl.insert(10))  # Should return False
+    print("Skip list contents:", sl.traverse())
+
+    # Searching and rank lookups
+    print("Searching for 40:", sl.search(40))  # Should return position 3
+    print("Searching for 35:", sl.search(35))  # Should return -1
+    print("Rank of 35:", sl.rank(35))  # Should return 3
+    print("Element with rank 1:", sl[1])  # Should return 20
+    print("Range [20, 45):", list(sl.range(20, 45)))
+
+    # Deleting elements
+    print("Deleting 30.")
+    sl.delete(30)
+    print("Skip list after deletion:", sl.traverse())
+    print("Element with rank 2:", sl[2])  # Should return 40
+
+def test_unrolled_linked_list():
+    print("\n# TESTING UNROLLED LINKED LIST")
+
+    ull = UnrolledLinkedList(node_capacity=4)
+
+    # Inserting enough elements to split blocks
+    print("Inserting 0 to 9 at the end and 100 at position 5.")
+    for value in range(10):
+        ull.insert_at_end(value)
+    ull.insert_at_position(5, 100)
+    print("List after insertions:", ull.traverse())
+
+    # Deleting elements
+    print("Deleting position 0, then the 100 now at position 4.")
+    ull.delete_at_position(0)
+    ull.delete_at_position(4)
+    print("List after deletions:", ull.traverse())
+
+    # Searching for elements
+    print("Searching for 7:", ull.search(7))  # Should return position 6
+    print("Searching for 100:", ull.search(100))  # Should return -1
+    print("Length of list:", len(ull))  # Should return 9
+
+def benchmark_unrolled(size=200_000):
+    """Compare traversal time and memory of LinkedList and UnrolledLinkedList."""
+    import time
+    import tracemalloc
+
+    print("\n# BENCHMARK: LINKED LIST VS UNROLLED LINKED LIST")
+    for cls in (LinkedList, UnrolledLinkedList):
+        tracemalloc.start()
+        lst = cls()
+        for i in range(size):
+            lst.insert_at_end(i)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        lst.traverse()
+        traversed = time.perf_counter() - start
+        start = time.perf_counter()
+        lst.search(-1)
+        searched = time.perf_counter() - start
+        print(f"{cls.__name__:<20} n={size}  traverse {traversed * 1e3:.1f}ms  "
+              f"search {searched * 1e3:.1f}ms  memory {memory / size:.1f} bytes/element")
+
+def benchmark_skip_list(sizes=(10_000, 100_000)):
+    """Compare SkipList with a bisect-maintained sorted list and BinaryTree."""
+    import bisect
+    import time
+    from Trees import BinaryTree
+
+    def sorted_list_insert(container, value):
+        index = bisect.bisect_left(container, value)
+        if index == len(container) or container[index] != value:
+            container.insert(index, value)
+
+    def sorted_list_search(container, value):
+        index = bisect.bisect_left(container, value)
+        return index < len(container) and container[index] == value
+
+    contenders = {
+        "SkipList": (SkipList, SkipList.insert, SkipList.search),
+        "sorted list + bisect": (list, sorted_list_insert, sorted_list_search),
+        "BinaryTree": (BinaryTree, BinaryTree.insert, BinaryTree.search),
+    }
+
+    print("\n# BENCHMARK: ORDERED CONTAINERS (random keys)")
+    for size in sizes:
+        keys = random.sample(range(size * 10), size)
+        for name, (factory, insert, search) in contenders.items():
+            container = factory()
+            start = time.perf_counter()
+            for key in keys:
+                insert(container, key)
+            built = time.perf_counter() - start
+            start = time.perf_counter()
+            for key in keys:
+                search(container, key)
+            searched = time.perf_counter() - start
+            print(f"{name:<21} n={size:<8} insert {built:.3f}s  search {searched:.3f}s")
+
+def benchmark_append(sizes=(10_000, 100_000, 1_000_000)):
+    """Time building lists by repeated insert_at_end to show linear growth."""
+    import time
+
+    print("\n# BENCHMARK: BUILDING LISTS WITH insert_at_end")
+    for cls in (LinkedList, DoublyLinkedList):
+        for size in sizes:
+            lst = cls()
+            start = time.perf_counter()
+            for i in range(size):
+                lst.insert_at_end(i)
+            elapsed = time.perf_counter() - start
+            print(f"{cls.__name__:<17} n={size:<9} {elapsed:.3f}s ({elapsed / size * 1e9:.0f} ns/element)")
 
 # Execute test cases
 if __name__ == "__main__":
     test_linked_list()
+    test_doubly_linked_list()
+    test_skip_list()
+    test_unrolled_linked_list()
+    benchmark_append(sizes=(10_000, 100_000))
+    benchmark_unrolled(size=100_000)
+    benchmark_skip_list(sizes=(10_000,))
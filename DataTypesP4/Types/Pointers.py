@@ -0,0 +1,409 @@
+# Pointers Implementation using an Arena of Integer Handles
+#
+# Instead of one Python object per node, every node lives in a row of parallel
+# arrays and a "pointer" is simply the integer index of that row.
+
+import pickle
+import struct
+from array import array
+
+NULL = -1  # The null pointer
+
+
+class PointerArena:
+    """A class to represent a pool of nodes stored in parallel typed arrays.
+
+    Only the columns a structure uses are allocated: lists pass
+    tree_links=False and values=False to keep just key and next, while trees
+    also get left, right and value. The next column always exists because
+    freed slots are threaded through it.
+    """
+
+    _HEADER = struct.Struct("<qqq2s??")
+
+    def __init__(self, key_typecode=None, tree_links=True, values=True):
+        """Create an empty arena; pass a typecode such as 'q' to store keys compactly."""
+        self.key_typecode = key_typecode
+        self.tree_links = tree_links
+        self.key = array(key_typecode) if key_typecode else []
+        self.value = [] if values else None
+        self.next = array("q")
+        self.left = array("q") if tree_links else None
+        self.right = array("q") if tree_links else None
+        self.live = bytearray()
+        self.free_head = NULL
+        self.count = 0
+
+    def _link_columns(self):
+        return ("next", "left", "right") if self.tree_links else ("next",)
+
+    def __len__(self):
+        """Return the number of allocated nodes."""
+        return self.count
+
+    def allocate(self, key, value=None):
+        """Allocate a node and return its handle, reusing freed slots first."""
+        if self.free_head != NULL:
+            handle = self.free_head
+            self.free_head = self.next[handle]
+            self.key[handle] = key
+            self.next[handle] = NULL
+            if self.value is not None:
+                self.value[handle] = value
+            if self.tree_links:
+                self.left[handle] = self.right[handle] = NULL
+            self.live[handle] = 1
+        else:
+            handle = len(self.next)
+            self.key.append(key)
+            self.next.append(NULL)
+            if self.value is not None:
+                self.value.append(value)
+            if self.tree_links:
+                self.left.append(NULL)
+                self.right.append(NULL)
+            self.live.append(1)
+        self.count += 1
+        return handle
+
+    def free(self, handle):
+        """Release a node, threading its slot onto the free list."""
+        if not self.live[handle]:
+            raise ValueError("Handle already freed.")
+        self.live[handle] = 0
+        if self.value is not None:
+            self.value[handle] = None
+        self.next[handle] = self.free_head
+        self.free_head = handle
+        self.count -= 1
+
+    def compact(self):
+        """Move live nodes to a dense prefix and return an old-to-new handle map."""
+        remap = array("q", [NULL]) * len(self.next)
+        new_handle = 0
+        for handle, alive in enumerate(self.live):
+            if alive:
+                remap[handle] = new_handle
+                new_handle += 1
+
+        def relink(links):
+            return array("q", (remap[links[h]] if links[h] != NULL else NULL
+                               for h, alive in enumerate(self.live) if alive))
+
+        live_handles = [h for h, alive in enumerate(self.live) if alive]
+        for name in self._link_columns():
+            setattr(self, name, relink(getattr(self, name)))
+        keys = [self.key[h] for h in live_handles]
+        self.key = array(self.key_typecode, keys) if self.key_typecode else keys
+        if self.value is not None:
+            self.value = [self.value[h] for h in live_handles]
+        self.live = bytearray(b"\x01") * len(live_handles)
+        self.free_head = NULL
+        return remap
+
+    def to_bytes(self):
+        """Serialize the whole arena into a single buffer."""
+        if self.key_typecode:
+            key_bytes = self.key.tobytes()
+        else:
+            key_bytes = pickle.dumps(self.key, protocol=pickle.HIGHEST_PROTOCOL)
+        value_bytes = pickle.dumps(self.value, protocol=pickle.HIGHEST_PROTOCOL)
+        header = self._HEADER.pack(len(self.next), self.free_head, self.count,
+                                   (self.key_typecode or "").encode().ljust(2),
+                                   self.tree_links, self.value is not None)
+        sizes = struct.pack("<qq", len(key_bytes), len(value_bytes))
+        links = [getattr(self, name).tobytes() for name in self._link_columns()]
+        return b"".join([header, sizes, *links, bytes(self.live), key_bytes, value_bytes])
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Rebuild an arena from a buffer produced by to_bytes()."""
+        view = memoryview(buffer)
+        slots, free_head, count, typecode, tree_links, values = cls._HEADER.unpack_from(view, 0)
+        offset = cls._HEADER.size
+        key_size, value_size = struct.unpack_from("<qq", view, offset)
+        offset += 16
+
+        arena = cls(typecode.decode().strip() or None, tree_links, values)
+        link_size = slots * arena.next.itemsize
+        for name in arena._link_columns():
+            links = array("q")
+            links.frombytes(view[offset:offset + link_size])
+            setattr(arena, name, links)
+            offset += link_size
+        arena.live = bytearray(view[offset:offset + slots])
+        offset += slots
+        if arena.key_typecode:
+            arena.key.frombytes(view[offset:offset + key_size])
+        else:
+            arena.key = pickle.loads(view[offset:offset + key_size])
+        offset += key_size
+        arena.value = pickle.loads(view[offset:offset + value_size])
+        arena.free_head = free_head
+        arena.count = count
+        return arena
+
+
+class ArenaLinkedList:
+    """A class to represent a singly linked list whose nodes live in a PointerArena."""
+
+    def __init__(self, key_typecode=None, arena=None):
+        self.arena = arena if arena is not None else PointerArena(key_typecode, tree_links=False,
+                                                                  values=False)
+        self.head = NULL
+        self.tail = NULL
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of nodes in constant time."""
+        return self.size
+
+    def __iter__(self):
+        """Yield node values from the head by following integer handles."""
+        key, next_ = self.arena.key, self.arena.next
+        current = self.head
+        while current != NULL:
+            yield key[current]
+            current = next_[current]
+
+    def insert_at_beginning(self, data):
+        """Insert a node at the beginning of the list."""
+        handle = self.arena.allocate(data)
+        self.arena.next[handle] = self.head
+        self.head = handle
+        if self.tail == NULL:
+            self.tail = handle
+        self.size += 1
+
+    def insert_at_end(self, data):
+        """Insert a node at the end of the list."""
+        handle = self.arena.allocate(data)
+        if self.tail == NULL:
+            self.head = handle
+        else:
+            self.arena.next[self.tail] = handle
+        self.tail = handle
+        self.size += 1
+
+    def delete_at_beginning(self):
+        """Delete the first node and return its value."""
+        if self.head == NULL:
+            raise IndexError("List is empty.")
+        handle = self.head
+        data = self.arena.key[handle]
+        self.head = self.arena.next[handle]
+        if self.head == NULL:
+            self.tail = NULL
+        self.arena.free(handle)
+        self.size -= 1
+        return data
+
+    def search(self, data):
+        """Search for a value and return its position, or -1 if absent."""
+        for position, value in enumerate(self):
+            if value == data:
+                return position
+        return -1
+
+    def traverse(self):
+        """Traverse the list and return a list of node values."""
+        return list(self)
+
+    def compact(self):
+        """Compact the underlying arena and remap the head and tail handles."""
+        remap = self.arena.compact()
+        if self.head != NULL:
+            self.head, self.tail = remap[self.head], remap[self.tail]
+
+    def to_bytes(self):
+        """Serialize the list, including its arena, into one buffer."""
+        return struct.pack("<qqq", self.head, self.tail, self.size) + self.arena.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Rebuild a list from a buffer produced by to_bytes()."""
+        lst = cls(arena=PointerArena.from_bytes(memoryview(buffer)[24:]))
+        lst.head, lst.tail, lst.size = struct.unpack_from("<qqq", buffer, 0)
+        return lst
+
+
+class ArenaBST:
+    """A class to represent a binary search tree whose nodes live in a PointerArena."""
+
+    def __init__(self, key_typecode=None, arena=None):
+        self.arena = arena if arena is not None else PointerArena(key_typecode)
+        self.root = NULL
+
+    def __len__(self):
+        """Return the number of nodes in the tree."""
+        return len(self.arena)
+
+    def insert(self, key, value=None):
+        """Insert a key-value pair, updating the value if the key exists."""
+        arena = self.arena
+        if self.root == NULL:
+            self.root = arena.allocate(key, value)
+            return
+        current = self.root
+        while True:
+            node_key = arena.key[current]
+            if key == node_key:
+                arena.value[current] = value
+                return
+            links = arena.left if key < node_key else arena.right
+            if links[current] == NULL:
+                links[current] = arena.allocate(key, value)
+                return
+            current = links[current]
+
+    def search(self, key):
+        """Return the value stored under key, or None if it is absent."""
+        arena = self.arena
+        current = self.root
+        while current != NULL:
+            node_key = arena.key[current]
+            if key == node_key:
+                return arena.value[current]
+            current = arena.left[current] if key < node_key else arena.right[current]
+        return None
+
+    def delete(self, key):
+        """Delete a key from the tree, returning False if it is absent."""
+        arena = self.arena
+        parent, current = NULL, self.root
+        while current != NULL and arena.key[current] != key:
+            parent = current
+            current = arena.left[current] if key < arena.key[current] else arena.right[current]
+        if current == NULL:
+            return False
+
+        if arena.left[current] != NULL and arena.right[current] != NULL:
+            # Copy the in-order successor into this slot, then unlink the successor
+            successor_parent, successor = current, arena.right[current]
+            while arena.left[successor] != NULL:
+                successor_parent, successor = successor, arena.left[successor]
+            arena.key[current] = arena.key[successor]
+            arena.value[current] = arena.value[successor]
+            parent, current = successor_parent, successor
+
+        child = arena.left[current] if arena.left[current] != NULL else arena.right[current]
+        if parent == NULL:
+            self.root = child
+        elif arena.left[parent] == current:
+            arena.left[parent] = child
+        else:
+            arena.right[parent] = child
+        arena.free(current)
+        return True
+
+    def inorder(self):
+        """Return (key, value) pairs in ascending key order without recursion."""
+        arena = self.arena
+        result = []
+        stack = []
+        current = self.root
+        while stack or current != NULL:
+            while current != NULL:
+                stack.append(current)
+                current = arena.left[current]
+            current = stack.pop()
+            result.append((arena.key[current], arena.value[current]))
+            current = arena.right[current]
+        return result
+
+    def compact(self):
+        """Compact the underlying arena and remap the root handle."""
+        remap = self.arena.compact()
+        if self.root != NULL:
+            self.root = remap[self.root]
+
+    def to_bytes(self):
+        """Serialize the tree, including its arena, into one buffer."""
+        return struct.pack("<q", self.root) + self.arena.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Rebuild a tree from a buffer produced by to_bytes()."""
+        tree = cls(arena=PointerArena.from_bytes(memoryview(buffer)[8:]))
+        tree.root = struct.unpack_from("<q", buffer, 0)[0]
+        return tree
+
+
+# Test Cases
+def test_arena_linked_list():
+    print("\n# TESTING ARENA LINKED LIST")
+    ll = ArenaLinkedList(key_typecode="q")
+
+    print("Inserting 10, 20, 30 at the end and 5 at the beginning.")
+    for value in [10, 20, 30]:
+        ll.insert_at_end(value)
+    ll.insert_at_beginning(5)
+    print("List after insertions:", ll.traverse())
+    print("Head handle:", ll.head, "Tail handle:", ll.tail)
+
+    print("Deleting from the beginning, then reusing the freed slot.")
+    ll.delete_at_beginning()
+    ll.insert_at_end(40)
+    print("List after reuse:", ll.traverse(), "Slots in arena:", len(ll.arena.next))
+    print("Searching for 30:", ll.search(30))  # Should return position 2
+
+    print("Round trip through bytes:", ArenaLinkedList.from_bytes(ll.to_bytes()).traverse())
+
+
+def test_arena_bst():
+    print("\n# TESTING ARENA BST")
+    bst = ArenaBST(key_typecode="q")
+
+    print("Inserting keys 10, 5, 15, 3, 7, 18.")
+    for key in [10, 5, 15, 3, 7, 18]:
+        bst.insert(key, f"Value{key}")
+    print("Inorder traversal:", bst.inorder())
+    print("Search key 7:", bst.search(7))
+
+    print("Deleting 10 and 3, then compacting the arena.")
+    bst.delete(10)
+    bst.delete(3)
+    bst.compact()
+    print("Inorder after compaction:", bst.inorder())
+    print("Slots in arena:", len(bst.arena.next))
+
+    restored = ArenaBST.from_bytes(bst.to_bytes())
+    print("Round trip through bytes:", restored.inorder())
+
+
+def benchmark_arena(size=100_000):
+    """Compare per-node memory of object-based and arena-based lists and trees."""
+    import gc
+    import random
+    import tracemalloc
+    from List import LinkedList
+    from Trees import BinaryTree
+
+    keys = random.sample(range(size * 10), size)
+    builders = {
+        "LinkedList (objects)": (LinkedList, LinkedList.insert_at_end),
+        "ArenaLinkedList": (lambda: ArenaLinkedList("q"), ArenaLinkedList.insert_at_end),
+        "BinaryTree (objects)": (BinaryTree, BinaryTree.insert),
+        "ArenaBST": (lambda: ArenaBST("q"), ArenaBST.insert),
+    }
+
+    print("\n# BENCHMARK: OBJECT NODES VS POINTER ARENA")
+    for name, (factory, insert) in builders.items():
+        gc.collect()
+        baseline = len(gc.get_objects())
+        tracemalloc.start()
+        structure = factory()
+        for key in keys:
+            insert(structure, key)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        tracked = len(gc.get_objects()) - baseline
+        print(f"{name:<22} n={size}  {memory / size:6.1f} bytes/node  new gc-tracked objects {tracked}")
+        del structure
+
+
+# Execute test cases
+if __name__ == "__main__":
+    test_arena_linked_list()
+    test_arena_bst()
+    benchmark_arena(size=50_000)
@@ -1,110 +1,383 @@
 
 # Binary Tree Implementation
 
+from collections import deque
+from itertools import islice
+
 class Node:
-    """A class to represent a node in the binary tree."""
+    """A class to represent a node in the binary tree.
+
+    Each node caches the size and height of its subtree.
+    """
+    __slots__ = ("key", "left", "right", "size", "height")
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
+        self.size = 1
+        self.height = 1
+
+def _size(node):
+    return node.size if node else 0
+
+def _height(node):
+    return node.height if node else 0
 
 class BinaryTree:
     """A class to represent a binary tree."""
     def __init__(self):
         self.root = None
 
+    def __len__(self):
+        """Return the number of keys in constant time."""
+        return _size(self.root)
+
+    def _update(self, node):
+        """Recompute the cached size and height of a node from its children."""
+        node.size = _size(node.left) + _size(node.right) + 1
+        node.height = max(_height(node.left), _height(node.right)) + 1
+
     def insert(self, key):
         """Insert a new key into the binary tree."""
         if not self.root:
             self.root = Node(key)
+            return
+
+        # Walk down iteratively so sorted input cannot exhaust the recursion limit
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = Node(key)
         else:
-            self._insert_recursive(self.root, key)
+            parent.right = Node(key)
+        for node in reversed(path):
+            self._update(node)
 
-    def _insert_recursive(self, node, key):
-        if key < node.key:
-            if node.left is None:
-                node.left = Node(key)
-            else:
-                self._insert_recursive(node.left, key)
+    def delete(self, key):
+        """Delete one occurrence of a key, returning False if it is absent."""
+        path = []
+        node = self.root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if not node:
+            return False
+
+        if node.left and node.right:
+            # Replace the key with its in-order successor and remove that node instead
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
         else:
-            if node.right is None:
-                node.right = Node(key)
-            else:
-                self._insert_recursive(node.right, key)
+            path[-1].right = child
+        for ancestor in reversed(path):
+            self._update(ancestor)
+        return True
 
     def search(self, key):
         """Search for a key in the binary tree."""
-        return self._search_recursive(self.root, key)
+        node = self.root
+        while node:
+            if node.key == key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
 
-    def _search_recursive(self, node, key):
-        if not node:
-            return False
-        if node.key == key:
-            return True
-        elif key < node.key:
-            return self._search_recursive(node.left, key)
-        else:
-            return self._search_recursive(node.right, key)
+    def iter_inorder(self):
+        """Yield keys in inorder (ascending) using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def iter_reverse_inorder(self):
+        """Yield keys in descending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.key
+            node = node.left
+
+    def iter_preorder(self):
+        """Yield keys in preorder using an explicit stack."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        """Yield keys in postorder using an explicit stack."""
+        for node in self._iter_postorder_nodes():
+            yield node.key
+
+    def _iter_postorder_nodes(self):
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and last_visited is not top.right:
+                    node = top.right
+                else:
+                    yield top
+                    last_visited = stack.pop()
+
+    def iter_level_order(self):
+        """Yield keys level by level, left to right."""
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield node.key
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def __iter__(self):
+        """Iterate over the keys in ascending order with O(height) memory."""
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        """Iterate over the keys in descending order with O(height) memory."""
+        return self.iter_reverse_inorder()
 
     def inorder_traversal(self):
         """Perform an inorder traversal of the binary tree."""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-
-    def _inorder_recursive(self, node, result):
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_recursive(node.right, result)
+        return list(self.iter_inorder())
 
     def preorder_traversal(self):
         """Perform a preorder traversal of the binary tree."""
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
-
-    def _preorder_recursive(self, node, result):
-        if node:
-            result.append(node.key)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        return list(self.iter_preorder())
 
     def postorder_traversal(self):
         """Perform a postorder traversal of the binary tree."""
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
+        return list(self.iter_postorder())
 
-    def _postorder_recursive(self, node, result):
-        if node:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.key)
+    def level_order_traversal(self):
+        """Perform a level-order (breadth-first) traversal of the binary tree."""
+        return list(self.iter_level_order())
 
     def height(self):
-        """Find the height of the binary tree."""
-        return self._height_recursive(self.root)
+        """Find the height of the binary tree from the cached root height."""
+        return _height(self.root)
 
-    def _height_recursive(self, node):
-        if not node:
-            return 0
-        left_height = self._height_recursive(node.left)
-        right_height = self._height_recursive(node.right)
-        return max(left_height, right_height) + 1
+    def _recomputed(self):
+        """Return {node: (height, size)} recomputed bottom-up, ignoring the cached fields."""
+        measured = {None: (0, 0)}
+        for node in self._iter_postorder_nodes():
+            left_height, left_size = measured[node.left]
+            right_height, right_size = measured[node.right]
+            measured[node] = (1 + max(left_height, right_height), 1 + left_size + right_size)
+        return measured
 
     def is_balanced(self):
-        """Check if the tree is balanced."""
-        def check_balance(node):
-            if not node:
-                return 0, True
-            left_height, left_balanced = check_balance(node.left)
-            right_height, right_balanced = check_balance(node.right)
-            balanced = abs(left_height - right_height) <= 1 and left_balanced and right_balanced
-            return max(left_height, right_height) + 1, balanced
-
-        _, balanced = check_balance(self.root)
-        return balanced
+        """Check if the tree is balanced, recomputing heights instead of trusting the cache."""
+        measured = self._recomputed()
+        return all(abs(measured[node.left][0] - measured[node.right][0]) <= 1
+                   for node in measured if node is not None)
+
+    def verify(self):
+        """Check that every cached height and size matches a fresh recomputation."""
+        measured = self._recomputed()
+        return all((node.height, node.size) == measured[node] for node in measured if node is not None)
+
+    # Order statistics and range queries, all O(log n + output) via cached sizes
+
+    def select(self, k):
+        """Return the k-th smallest key (0-based)."""
+        if not 0 <= k < len(self):
+            raise IndexError("Rank out of bounds.")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def _count_below(self, key, inclusive):
+        count = 0
+        node = self.root
+        while node:
+            if node.key < key or (inclusive and node.key == key):
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def rank(self, key):
+        """Return the number of keys strictly smaller than key."""
+        return self._count_below(key, inclusive=False)
+
+    def floor(self, key):
+        """Return the largest key <= key, or None if there is none."""
+        result = None
+        node = self.root
+        while node:
+            if node.key == key:
+                return node.key
+            if node.key > key:
+                node = node.left
+            else:
+                result = node.key
+                node = node.right
+        return result
+
+    def ceiling(self, key):
+        """Return the smallest key >= key, or None if there is none."""
+        result = None
+        node = self.root
+        while node:
+            if node.key == key:
+                return node.key
+            if node.key < key:
+                node = node.right
+            else:
+                result = node.key
+                node = node.left
+        return result
+
+    def count_range(self, lo, hi):
+        """Return how many keys lie in the closed interval [lo, hi]."""
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def range(self, lo, hi):
+        """Lazily yield the keys in [lo, hi] in ascending order."""
+        stack = []
+        node = self.root
+        while stack or node:
+            if node:
+                if node.key < lo:
+                    node = node.right  # The whole left subtree is below lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if node.key > hi:
+                    return
+                yield node.key
+                node = node.right
+
+class AVLTree(BinaryTree):
+    """A class to represent a self-balancing (AVL) binary search tree.
+
+    Subtree heights never differ by more than one, so insert, delete and
+    search are all O(log n) whatever order the keys arrive in.
+    """
+    def insert(self, key):
+        """Insert a new key and rebalance the path back to the root."""
+        self.root = self._insert_recursive(self.root, key)
+
+    def _insert_recursive(self, node, key):
+        if not node:
+            return Node(key)
+        if key < node.key:
+            node.left = self._insert_recursive(node.left, key)
+        else:
+            node.right = self._insert_recursive(node.right, key)
+        return self._rebalance(node)
+
+    def delete(self, key):
+        """Delete one occurrence of a key, returning False if it is absent."""
+        if not self.search(key):
+            return False
+        self.root = self._delete_recursive(self.root, key)
+        return True
+
+    def _delete_recursive(self, node, key):
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if not node.left:
+                return node.right
+            if not node.right:
+                return node.left
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key = successor.key
+            node.right = self._delete_min(node.right)
+        return self._rebalance(node)
+
+    def _delete_min(self, node):
+        if not node.left:
+            return node.right
+        node.left = self._delete_min(node.left)
+        return self._rebalance(node)
+
+    @staticmethod
+    def _balance_factor(node):
+        return _height(node.left) - _height(node.right)
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        self._update(node)
+        balance = self._balance_factor(node)
+        if balance > 1:
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
 
 # Test Cases for the BinaryTree Class
 def test_binary_tree():
@@ -120,6 +393,9 @@ def test_binary_tree():
     print("Inorder Traversal:", tree.inorder_traversal())
     print("Preorder Traversal:", tree.preorder_traversal())
     print("Postorder Traversal:", tree.postorder_traversal())
+    print("Level-order Traversal:", tree.level_order_traversal())
+    print("Reverse Inorder:", list(reversed(tree)))
+    print("First three keys (streamed):", list(islice(tree, 3)))
 
     # Search for nodes
     print("Searching for node 7:", tree.search(7))
@@ -130,7 +406,77 @@ def test_binary_tree():
 
     # Check if the tree is balanced
     print("Is the tree balanced?:", tree.is_balanced())
+    print("Cached heights and sizes correct?:", tree.verify())
+
+def test_avl_tree():
+    print("\n# TESTING AVL TREE")
+    tree = AVLTree()
+
+    # Sorted input would degenerate a plain BinaryTree into a linked list
+    print("Inserting keys 1 to 100 in sorted order")
+    for key in range(1, 101):
+        tree.insert(key)
+    print("Height of tree:", tree.height())  # Should be at most 8
+    print("Is the tree balanced?:", tree.is_balanced())
+    print("Cached heights and sizes correct?:", tree.verify())
+    print("Searching for node 64:", tree.search(64))
+
+    # Delete every even key
+    print("Deleting all even keys")
+    for key in range(2, 101, 2):
+        tree.delete(key)
+    print("First keys in order:", tree.inorder_traversal()[:5])
+    print("Searching for node 64:", tree.search(64))
+    print("Height of tree:", tree.height())
+    print("Is the tree balanced?:", tree.is_balanced())
+    print("Cached heights and sizes correct?:", tree.verify())
+
+def test_order_statistics():
+    print("\n# TESTING ORDER STATISTICS AND RANGE QUERIES")
+    tree = AVLTree()
+
+    print("Inserting keys 10, 20, ..., 100")
+    for key in range(10, 101, 10):
+        tree.insert(key)
+
+    print("Number of keys:", len(tree))  # Should return 10
+    print("3rd smallest key (select(2)):", tree.select(2))  # Should return 30
+    print("Rank of 55:", tree.rank(55))  # Should return 5
+    print("Floor of 55:", tree.floor(55))  # Should return 50
+    print("Ceiling of 55:", tree.ceiling(55))  # Should return 60
+    print("Keys in [25, 75]:", tree.count_range(25, 75))  # Should return 5
+    print("Range scan [25, 75]:", list(tree.range(25, 75)))
+
+    print("Deleting 30 and 40")
+    tree.delete(30)
+    tree.delete(40)
+    print("3rd smallest key (select(2)):", tree.select(2))  # Should return 50
+    print("Keys in [25, 75]:", tree.count_range(25, 75))  # Should return 3
+
+def benchmark_balanced(sizes=(1_000, 4_000)):
+    """Compare BinaryTree and AVLTree on sorted and random insertion orders."""
+    import random
+    import time
+
+    print("\n# BENCHMARK: BINARY TREE VS AVL TREE")
+    for size in sizes:
+        orders = {"sorted": list(range(size)), "random": random.sample(range(size), size)}
+        for order, keys in orders.items():
+            for cls in (BinaryTree, AVLTree):
+                tree = cls()
+                start = time.perf_counter()
+                for key in keys:
+                    tree.insert(key)
+                built = time.perf_counter() - start
+                start = time.perf_counter()
+                for key in keys:
+                    tree.search(key)
+                searched = time.perf_counter() - start
+                print(f"{cls.__name__:<11} {order:<7} n={size:<7} insert {built:.3f}s  search {searched:.3f}s")
 
 # Execution
 if __name__ == "__main__":
     test_binary_tree()
+    test_avl_tree()
+    test_order_statistics()
+    benchmark_balanced()
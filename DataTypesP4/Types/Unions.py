@@ -1,8 +1,666 @@
 # Set Operations Implementation
+import hashlib
+import heapq
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+
 def union_sets(set1, set2):
     """Return the union of two sets."""
     return set1.union(set2)
 
+
+# Streaming Set Operations on Sorted Inputs
+def union_sorted(*iterables):
+    """Yield the sorted, de-duplicated union of any number of sorted iterables.
+
+    heapq.merge holds one pending item per input, so memory stays O(k) however
+    long the inputs are.
+    """
+    for value, _ in groupby(heapq.merge(*iterables)):
+        yield value
+
+def intersect_sorted(*iterables):
+    """Yield the sorted values present in every one of the sorted iterables.
+
+    Each input is advanced up to the largest current value, and the walk stops
+    as soon as any input runs out, since nothing after that can be common.
+    """
+    if not iterables:
+        return
+    iterators = [iter(items) for items in iterables]
+    try:
+        current = [next(iterator) for iterator in iterators]
+        while True:
+            target = max(current)
+            matched = True
+            for i, iterator in enumerate(iterators):
+                while current[i] < target:
+                    current[i] = next(iterator)
+                if current[i] != target:
+                    matched = False
+            if matched:
+                yield target
+                # Skip duplicates of the value just emitted in every input
+                for i, iterator in enumerate(iterators):
+                    while current[i] == target:
+                        current[i] = next(iterator)
+    except StopIteration:
+        return
+
+def difference_sorted(first, *others):
+    """Yield the sorted values of the first iterable that are in none of the others.
+
+    The other inputs are merged into one stream and walked alongside the first,
+    stopping when the first input runs out.
+    """
+    sentinel = object()
+    excluded = union_sorted(*others)
+    blocker = next(excluded, sentinel)
+    previous = sentinel
+    for value in first:
+        if value == previous:
+            continue
+        previous = value
+        while blocker is not sentinel and blocker < value:
+            blocker = next(excluded, sentinel)
+        if blocker is sentinel or blocker != value:
+            yield value
+
+
+# Parallel Set Operations on Hash-Partitioned Shards
+_SET_OPERATIONS = {
+    "union": lambda first, *rest: first.union(*rest),
+    "intersection": lambda first, *rest: first.intersection(*rest),
+    "difference": lambda first, *rest: first.difference(*rest),
+}
+
+def _shard_operation(operation, shard_sets):
+    return _SET_OPERATIONS[operation](*shard_sets)
+
+def parallel_set_operation(operation, sets, shards=4, max_workers=None):
+    """Apply a set operation by hash-partitioning the inputs across processes.
+
+    Equal items always land in the same shard, so each shard's result is
+    independent and the shard results are disjoint and simply concatenated.
+    """
+    if operation not in _SET_OPERATIONS:
+        raise ValueError(f"Unknown set operation: {operation!r}")
+    if not sets:
+        raise ValueError("parallel_set_operation needs at least one set")
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    partitions = [[set() for _ in sets] for _ in range(shards)]
+    for position, items in enumerate(sets):
+        for item in items:
+            partitions[hash(item) % shards][position].add(item)
+    result = set()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for shard_result in pool.map(_shard_operation, [operation] * shards, partitions):
+            result.update(shard_result)
+    return result
+
+
+# Bitset Implementation
+class BitSet:
+    """A class to represent a set of non-negative integers as compressed chunks.
+
+    The id space is split into chunks of 2**16 ids and empty chunks are not
+    stored. A chunk holding at most 4096 members is a sorted array('H') of
+    offsets, two bytes per member; a fuller chunk is one int whose bit i is set
+    when chunk_base + i is a member, a fixed 8 KiB that is smaller past that
+    point. So BitSet([10**9]) costs a one-element array while a dense set of n
+    small ids needs about n / 8 bytes. Set algebra runs chunk by chunk, with
+    big-integer arithmetic between bitmaps and merges for arrays. A single
+    long run still costs one bit per id; to_runs() gives the compact form.
+    """
+
+    _CHUNK_BITS = 16
+    _CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+    _ARRAY_LIMIT = 4096
+    _HEADER = struct.Struct("<4sq")
+    _CHUNK = struct.Struct("<qBI")
+    _MAGIC = b"BIT3"
+
+    def __init__(self, items=()):
+        groups = {}
+        for item in items:
+            if item < 0:
+                raise ValueError("BitSet members must be non-negative.")
+            groups.setdefault(item >> self._CHUNK_BITS, set()).add(item & self._CHUNK_MASK)
+        self.chunks = {chunk: self._container(sorted(offsets)) for chunk, offsets in groups.items()}
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        result = cls()
+        result.chunks = chunks
+        return result
+
+    # Chunk containers: sorted array('H') up to _ARRAY_LIMIT members, int bitmap above
+    @classmethod
+    def _container(cls, offsets):
+        """Return the container for sorted, distinct offsets, or None when there are none."""
+        if len(offsets) > cls._ARRAY_LIMIT:
+            return cls._bitmap(offsets)
+        return array("H", offsets) if len(offsets) else None
+
+    @classmethod
+    def _compact(cls, bits):
+        """Return the container for a bitmap, or None when it is empty."""
+        if bits.bit_count() > cls._ARRAY_LIMIT:
+            return bits
+        return array("H", cls._iter_bits(bits, 0)) if bits else None
+
+    @classmethod
+    def _bitmap(cls, container):
+        if isinstance(container, int):
+            return container
+        data = bytearray(1 << (cls._CHUNK_BITS - 3))
+        for offset in container:
+            data[offset >> 3] |= 1 << (offset & 7)
+        return int.from_bytes(data, "little")
+
+    @classmethod
+    def _bitmap_bytes(cls, bits):
+        return bits.to_bytes(1 << (cls._CHUNK_BITS - 3), "little")
+
+    @staticmethod
+    def _copy(container):
+        return container if isinstance(container, int) else container[:]
+
+    @classmethod
+    def _union_chunk(cls, a, b):
+        if isinstance(a, int) or isinstance(b, int):
+            return cls._bitmap(a) | cls._bitmap(b)
+        return cls._container(sorted(set(a).union(b)))
+
+    @classmethod
+    def _intersection_chunk(cls, a, b):
+        if isinstance(a, int) and isinstance(b, int):
+            return cls._compact(a & b)
+        if isinstance(a, int):
+            a, b = b, a
+        if isinstance(b, int):
+            data = cls._bitmap_bytes(b)
+            offsets = [offset for offset in a if data[offset >> 3] >> (offset & 7) & 1]
+        else:
+            small, large = sorted((a, b), key=len)
+            members = set(large)
+            offsets = [offset for offset in small if offset in members]
+        return array("H", offsets) if offsets else None
+
+    @classmethod
+    def _difference_chunk(cls, a, b):
+        if isinstance(a, int):
+            return cls._compact(a & ~cls._bitmap(b))
+        if isinstance(b, int):
+            data = cls._bitmap_bytes(b)
+            offsets = [offset for offset in a if not data[offset >> 3] >> (offset & 7) & 1]
+        else:
+            members = set(b)
+            offsets = [offset for offset in a if offset not in members]
+        return array("H", offsets) if offsets else None
+
+    @classmethod
+    def _symmetric_difference_chunk(cls, a, b):
+        if isinstance(a, int) or isinstance(b, int):
+            return cls._compact(cls._bitmap(a) ^ cls._bitmap(b))
+        return cls._container(sorted(set(a).symmetric_difference(b)))
+
+    def add(self, item):
+        """Add a non-negative integer to the set."""
+        if item < 0:
+            raise ValueError("BitSet members must be non-negative.")
+        chunk, offset = item >> self._CHUNK_BITS, item & self._CHUNK_MASK
+        container = self.chunks.get(chunk)
+        if container is None:
+            self.chunks[chunk] = array("H", (offset,))
+        elif isinstance(container, int):
+            self.chunks[chunk] = container | 1 << offset
+        else:
+            index = bisect_left(container, offset)
+            if index == len(container) or container[index] != offset:
+                container.insert(index, offset)
+                if len(container) > self._ARRAY_LIMIT:
+                    self.chunks[chunk] = self._bitmap(container)
+
+    def discard(self, item):
+        """Remove an integer from the set if it is present."""
+        if item < 0:
+            return
+        chunk, offset = item >> self._CHUNK_BITS, item & self._CHUNK_MASK
+        container = self.chunks.get(chunk)
+        if container is None:
+            return
+        if isinstance(container, int):
+            container = self._compact(container & ~(1 << offset))
+        else:
+            index = bisect_left(container, offset)
+            if index < len(container) and container[index] == offset:
+                del container[index]
+        if container:
+            self.chunks[chunk] = container
+        else:
+            del self.chunks[chunk]
+
+    def is_member(self, item):
+        """Check whether an integer is in the set."""
+        if item < 0:
+            return False
+        container = self.chunks.get(item >> self._CHUNK_BITS)
+        if container is None:
+            return False
+        offset = item & self._CHUNK_MASK
+        if isinstance(container, int):
+            return (container >> offset) & 1 == 1
+        index = bisect_left(container, offset)
+        return index < len(container) and container[index] == offset
+
+    __contains__ = is_member
+
+    def union(self, other):
+        """Return the union of two bitsets."""
+        chunks = {chunk: self._copy(container) for chunk, container in self.chunks.items()}
+        for chunk, container in other.chunks.items():
+            mine = chunks.get(chunk)
+            chunks[chunk] = self._copy(container) if mine is None else self._union_chunk(mine, container)
+        return self._from_chunks(chunks)
+
+    def intersection(self, other):
+        """Return the intersection of two bitsets, visiting the smaller one's chunks."""
+        small, large = sorted((self.chunks, other.chunks), key=len)
+        chunks = {}
+        for chunk, container in small.items():
+            if chunk in large:
+                container = self._intersection_chunk(container, large[chunk])
+                if container is not None:
+                    chunks[chunk] = container
+        return self._from_chunks(chunks)
+
+    def difference(self, other):
+        """Return the members of this bitset that are not in the other."""
+        chunks = {}
+        for chunk, container in self.chunks.items():
+            theirs = other.chunks.get(chunk)
+            if theirs is None:
+                chunks[chunk] = self._copy(container)
+            else:
+                container = self._difference_chunk(container, theirs)
+                if container is not None:
+                    chunks[chunk] = container
+        return self._from_chunks(chunks)
+
+    def symmetric_difference(self, other):
+        """Return the members that are in exactly one of the two bitsets."""
+        chunks = {chunk: self._copy(container) for chunk, container in self.chunks.items()}
+        for chunk, container in other.chunks.items():
+            mine = chunks.get(chunk)
+            if mine is not None:
+                container = self._symmetric_difference_chunk(mine, container)
+            if container is None:
+                del chunks[chunk]
+            else:
+                chunks[chunk] = self._copy(container) if mine is None else container
+        return self._from_chunks(chunks)
+
+    __or__, __and__, __sub__, __xor__ = union, intersection, difference, symmetric_difference
+
+    def __eq__(self, other):
+        return isinstance(other, BitSet) and self.chunks == other.chunks
+
+    def __len__(self):
+        """Return the cardinality (number of members)."""
+        return sum(container.bit_count() if isinstance(container, int) else len(container)
+                   for container in self.chunks.values())
+
+    def __iter__(self):
+        """Yield the members in ascending order, skipping empty bytes of bitmaps quickly."""
+        for chunk in sorted(self.chunks):
+            container, base = self.chunks[chunk], chunk << self._CHUNK_BITS
+            if isinstance(container, int):
+                yield from self._iter_bits(container, base)
+            else:
+                yield from map(base.__add__, container)
+
+    @staticmethod
+    def _iter_bits(bits, base):
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            offset = base + byte_index * 8
+            while byte:
+                low = byte & -byte
+                yield offset + low.bit_length() - 1
+                byte ^= low
+
+    def __repr__(self):
+        return f"BitSet({list(self)})"
+
+    def nbytes(self):
+        """Return the approximate memory used by the chunk containers and their table."""
+        return sys.getsizeof(self.chunks) + sum(sys.getsizeof(container) for container in self.chunks.values())
+
+    def to_runs(self):
+        """Return the members as run-length encoded (start, length) pairs.
+
+        Run boundaries in a bitmap are found with shifts and masks, so the cost
+        follows the number of runs and chunks rather than the number of members.
+        """
+        runs = []
+        for chunk in sorted(self.chunks):
+            container, base = self.chunks[chunk], chunk << self._CHUNK_BITS
+            if isinstance(container, int):
+                starts = self._iter_bits(container & ~(container << 1), base)
+                ends = self._iter_bits(container & ~(container >> 1), base)
+                bounds = zip(starts, ends)
+            else:
+                bounds = self._array_runs(container, base)
+            for start, end in bounds:
+                if runs and runs[-1][0] + runs[-1][1] == start:
+                    runs[-1][1] += end - start + 1  # The run continues from the previous chunk
+                else:
+                    runs.append([start, end - start + 1])
+        return [tuple(run) for run in runs]
+
+    @staticmethod
+    def _array_runs(offsets, base):
+        """Yield the first and last member of each run of consecutive offsets."""
+        start = previous = None
+        for offset in offsets:
+            if previous is None or offset != previous + 1:
+                if start is not None:
+                    yield base + start, base + previous
+                start = offset
+            previous = offset
+        if start is not None:
+            yield base + start, base + previous
+
+    @classmethod
+    def from_runs(cls, runs):
+        """Build a bitset from (start, length) pairs produced by to_runs()."""
+        chunks = {}
+        for start, length in runs:
+            stop = start + length
+            while start < stop:
+                chunk = start >> cls._CHUNK_BITS
+                chunk_stop = min(stop, (chunk + 1) << cls._CHUNK_BITS)
+                mask = ((1 << (chunk_stop - start)) - 1) << (start & cls._CHUNK_MASK)
+                chunks[chunk] = chunks.get(chunk, 0) | mask
+                start = chunk_stop
+        return cls._from_chunks({chunk: cls._compact(bits) for chunk, bits in chunks.items()})
+
+    def to_bytes(self):
+        """Serialize the chunks, tagging each as an offset array (0) or a little-endian bitmap (1)."""
+        parts = [self._HEADER.pack(self._MAGIC, len(self.chunks))]
+        for chunk in sorted(self.chunks):
+            container = self.chunks[chunk]
+            if isinstance(container, int):
+                kind, data = 1, container.to_bytes((container.bit_length() + 7) // 8, "little")
+            else:
+                kind, data = 0, container.tobytes()
+            parts.append(self._CHUNK.pack(chunk, kind, len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a bitset from bytes produced by to_bytes()."""
+        view = memoryview(data)
+        magic, count = cls._HEADER.unpack_from(view, 0)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a serialized BitSet.")
+        offset = cls._HEADER.size
+        chunks = {}
+        for _ in range(count):
+            chunk, kind, size = cls._CHUNK.unpack_from(view, offset)
+            offset += cls._CHUNK.size
+            if kind:
+                chunks[chunk] = int.from_bytes(view[offset:offset + size], "little")
+            else:
+                chunks[chunk] = array("H")
+                chunks[chunk].frombytes(view[offset:offset + size])
+            offset += size
+        return cls._from_chunks(chunks)
+
+
+# Bloom Filter Implementation
+def _bloom_key(item):
+    """Encode an item as bytes so that items which compare equal encode equally.
+
+    Only str, bytes, int, bool, float and tuples of them are accepted; other
+    types have no stable byte form that agrees with ==, so they raise TypeError.
+    """
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)
+    if isinstance(item, int):
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, float):
+        return b"f" + item.hex().encode()
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, bytes):
+        return b"b" + item
+    if isinstance(item, tuple):
+        parts = [_bloom_key(part) for part in item]
+        return b"t" + b"".join(struct.pack("<I", len(part)) + part for part in parts)
+    raise TypeError(f"BloomFilter keys must be str, bytes, int, float or tuples of them, "
+                    f"not {type(item).__name__}")
+
+class BloomFilter:
+    """A class to represent a probabilistic set that never gives false negatives.
+
+    Members are hashed into a fixed bit array, so memory depends only on the
+    expected cardinality and false-positive rate, not on the size of the items.
+    Hashes use blake2b over a canonical encoding of the item's value (so 1,
+    1.0 and True agree, as they do in a set), which keeps them stable across
+    processes so a serialized filter answers the same way when reloaded.
+    Keys are limited to str, bytes, int, float, bool and tuples of them.
+    """
+
+    _HEADER = struct.Struct("<4sqqq")
+    _MAGIC = b"BLM1"
+
+    def __init__(self, expected_items, false_positive_rate=0.01):
+        if expected_items <= 0:
+            raise ValueError("expected_items must be positive.")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1.")
+        num_bits = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, round(self.num_bits / expected_items * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def from_iterable(cls, items, false_positive_rate=0.01):
+        """Build a filter sized for a collection that supports len()."""
+        bloom = cls(max(1, len(items)), false_positive_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(_bloom_key(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Add an item to the filter."""
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def is_member(self, item):
+        """Return False if the item is definitely absent, True if it may be present."""
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    __contains__ = is_member
+
+    def union(self, other):
+        """Return a filter containing the members of both filters (bitwise OR)."""
+        if (self.num_bits, self.num_hashes) != (other.num_bits, other.num_hashes):
+            raise ValueError("Only filters with the same size and hash count can be combined.")
+        result = self._empty_like()
+        result.bits = bytearray((int.from_bytes(self.bits, "little")
+                                 | int.from_bytes(other.bits, "little"))
+                                .to_bytes(len(self.bits), "little"))
+        result.count = self.count + other.count
+        return result
+
+    __or__ = union
+
+    def _empty_like(self):
+        result = BloomFilter.__new__(BloomFilter)
+        result.num_bits, result.num_hashes = self.num_bits, self.num_hashes
+        result.bits = bytearray(len(self.bits))
+        result.count = 0
+        return result
+
+    def estimated_false_positive_rate(self):
+        """Return the expected false-positive rate for the items added so far."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def to_bytes(self):
+        """Serialize the filter parameters and bit array."""
+        return self._HEADER.pack(self._MAGIC, self.num_bits, self.num_hashes, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a filter from bytes produced by to_bytes()."""
+        magic, num_bits, num_hashes, count = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a serialized BloomFilter.")
+        bloom = cls.__new__(cls)
+        bloom.num_bits, bloom.num_hashes, bloom.count = num_bits, num_hashes, count
+        bloom.bits = bytearray(data[cls._HEADER.size:])
+        return bloom
+
+
+class FilteredMembership:
+    """A class to put a Bloom filter in front of an exact membership check.
+
+    The source can be anything with is_member() or ``in``: a set, a UnionSet,
+    or a UnionOperations. Lookups the filter rejects never reach the source.
+    Sources that cannot be iterated, such as UnionOperations, need their
+    members passed as items, e.g. FilteredMembership(ops, items=ops.union()).
+    Items added to the source directly, rather than through add(), are not
+    seen by the filter.
+    """
+
+    def __init__(self, source, items=None, false_positive_rate=0.01):
+        self.source = source
+        if items is None:
+            try:
+                items = list(source)
+            except TypeError:
+                raise TypeError(f"{type(source).__name__} is not iterable; pass its members as items")
+        self.bloom = BloomFilter.from_iterable(items, false_positive_rate)
+        self.source_lookups = 0
+
+    def add(self, item):
+        """Add an item to both the filter and the source."""
+        if not hasattr(self.source, "add"):
+            raise TypeError(f"{type(self.source).__name__} does not support add()")
+        self.bloom.add(item)
+        self.source.add(item)
+
+    def is_member(self, item):
+        """Check the filter first and fall back to the exact source.
+
+        Items the filter cannot encode go straight to the source.
+        """
+        try:
+            maybe_present = self.bloom.is_member(item)
+        except TypeError:
+            maybe_present = True
+        if not maybe_present:
+            return False
+        self.source_lookups += 1
+        if hasattr(self.source, "is_member"):
+            return self.source.is_member(item)
+        return item in self.source
+
+    __contains__ = is_member
+
+
+# Disjoint-Set (Union-Find) Implementation
+class DisjointSet:
+    """A class to represent disjoint groups of integer ids 0..n-1.
+
+    Parents and group sizes are stored in typed arrays. find() compresses
+    paths and union() links the smaller group under the larger one, so a
+    sequence of m operations runs in near-linear O(m * alpha(n)) time.
+    """
+
+    def __init__(self, size=0):
+        """Create size singleton groups with ids 0 to size - 1."""
+        self.parent = array("l", range(size))
+        self.size = array("l", [1]) * size
+        self.components = size
+
+    def __len__(self):
+        """Return the number of ids."""
+        return len(self.parent)
+
+    def add(self):
+        """Add a new singleton group and return its id."""
+        new_id = len(self.parent)
+        self.parent.append(new_id)
+        self.size.append(1)
+        self.components += 1
+        return new_id
+
+    def find(self, x):
+        """Return the representative id of the group containing x."""
+        if x < 0:
+            raise ValueError("DisjointSet ids must be non-negative.")
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Point every node on the path straight at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        """Merge the groups of a and b, returning False if already joined."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.components -= 1
+        return True
+
+    def connected(self, a, b):
+        """Check whether a and b belong to the same group."""
+        return self.find(a) == self.find(b)
+
+    def group_size(self, x):
+        """Return the number of ids in the group containing x."""
+        return self.size[self.find(x)]
+
+    def groups(self):
+        """Return a dict mapping each representative to the ids in its group."""
+        result = {}
+        for x in range(len(self.parent)):
+            result.setdefault(self.find(x), []).append(x)
+        return result
+
 # Test Cases for Set Operations
 def test_union_sets():
     print("\n# TESTING UNION OF SETS")
@@ -35,6 +693,187 @@ def test_union_sets():
     print("Set 2:", set2)
     print("Union of similar sets:", union_sets(set1, set2))
 
+def test_sorted_set_operations():
+    print("\n# TESTING STREAMING SORTED SET OPERATIONS")
+
+    evens = range(0, 20, 2)
+    threes = iter([0, 3, 6, 9, 12, 15, 18])
+    print("Union:", list(union_sorted(evens, iter([1, 2, 3]), [])))
+    print("Intersection:", list(intersect_sorted(evens, threes)))  # Should return [0, 6, 12, 18]
+    print("Difference:", list(difference_sorted(evens, [4, 8], [0, 16, 16])))  # Should return [2, 6, 10, 12, 14, 18]
+
+    # Process-pool mode over hash-partitioned shards
+    set1, set2 = set(range(0, 1000, 2)), set(range(0, 1000, 3))
+    parallel = parallel_set_operation("intersection", [set1, set2], shards=2, max_workers=2)
+    print("Parallel intersection matches?:", parallel == set1 & set2)
+
+def test_disjoint_set():
+    print("\n# TESTING DISJOINT SET (UNION-FIND)")
+
+    ds = DisjointSet(8)
+    print("Created 8 singleton groups:", ds.components, "components")
+
+    # Merge ids into connected components
+    for a, b in [(0, 1), (1, 2), (3, 4), (5, 6), (6, 7), (2, 7)]:
+        ds.union(a, b)
+    print("After unions (0,1) (1,2) (3,4) (5,6) (6,7) (2,7):", ds.components, "components")
+    print("Are 0 and 5 connected?:", ds.connected(0, 5))  # Should return True
+    print("Are 0 and 3 connected?:", ds.connected(0, 3))  # Should return False
+    print("Size of the group containing 0:", ds.group_size(0))  # Should return 6
+    print("Groups:", sorted(ds.groups().values()))
+
+    # Adding a new id later
+    new_id = ds.add()
+    print("Added id", new_id, "->", ds.components, "components")
+    try:
+        ds.find(-1)
+    except ValueError as error:
+        print("Finding id -1:", error)  # Should raise instead of reading from the end
+
+def test_bitset():
+    print("\n# TESTING BITSET")
+
+    set1 = BitSet([1, 2, 3, 10])
+    set2 = BitSet([3, 4, 5, 10, 64])
+    print("Set 1:", set1)
+    print("Set 2:", set2)
+    print("Union:", set1.union(set2))
+    print("Intersection:", set1.intersection(set2))  # Should return [3, 10]
+    print("Difference:", set1.difference(set2))  # Should return [1, 2]
+    print("Is 64 a member of set 2?:", set2.is_member(64))
+    print("Cardinality of the union:", len(set1 | set2))  # Should return 7
+
+    # Run-length compression for clustered ids
+    clustered = BitSet(list(range(100, 200)) + list(range(1000, 1010)))
+    print("Runs of a clustered set:", clustered.to_runs())
+    print("Round trip through runs equal?:", BitSet.from_runs(clustered.to_runs()) == clustered)
+
+    # Sparse ids only store the chunks they touch
+    sparse = BitSet([5, 10**9])
+    print("Sparse set:", sparse, "bytes:", sparse.nbytes())  # Two one-element arrays, not 125 MB
+    scattered = BitSet(range(65535, 65535 * 1001, 65535))
+    print("1000 scattered ids, bytes:", scattered.nbytes())  # About 120 bytes per id, not 8 KiB
+
+def test_bloom_filter():
+    print("\n# TESTING BLOOM FILTER")
+
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    for word in ("apple", "banana", "cherry"):
+        bloom.add(word)
+    print("Bits, hashes:", bloom.num_bits, bloom.num_hashes)
+    print("Is 'banana' maybe present?:", bloom.is_member("banana"))  # Always True
+    print("Is 'durian' maybe present?:", bloom.is_member("durian"))  # Almost surely False
+
+    other = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    other.add("durian")
+    combined = bloom | other
+    print("Is 'durian' in the union?:", "durian" in combined)  # Should return True
+    restored = BloomFilter.from_bytes(combined.to_bytes())
+    print("Round trip keeps members?:", all(w in restored for w in ("apple", "durian")))
+
+    # Pre-check in front of an exact set: negatives rarely reach the set
+    exact = set(range(0, 2000, 2))
+    filtered = FilteredMembership(exact)
+    hits = sum(filtered.is_member(n) for n in range(2000))
+    print("Members found:", hits)  # Should return 1000
+    print("Lookups that reached the exact set:", filtered.source_lookups)
+    print("Is 4.0 a member? (4.0 == 4):", 4.0 in filtered)  # Should return True, like a set
+
+def benchmark_bloom_filter(size=200_000, false_positive_rate=0.01):
+    """Measure memory and observed false-positive rate against a Python set."""
+    import time
+
+    members = [f"user-{i}" for i in range(size)]
+    probes = [f"guest-{i}" for i in range(size)]
+    print(f"\n# BENCHMARK: BLOOM FILTER ({size:,} items, target fp rate {false_positive_rate})")
+    start = time.perf_counter()
+    bloom = BloomFilter.from_iterable(members, false_positive_rate)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    false_positives = sum(bloom.is_member(probe) for probe in probes)
+    lookup = (time.perf_counter() - start) / size
+    exact = set(members)
+    exact_bytes = sys.getsizeof(exact) + sum(sys.getsizeof(m) for m in members)
+    print(f"build {build:.3f}s, lookup {lookup * 1e9:.0f} ns, "
+          f"observed fp rate {false_positives / size:.4f}")
+    print(f"filter {len(bloom.bits) / 2**10:.1f} KiB vs exact set {exact_bytes / 2**10:.1f} KiB")
+
+def benchmark_sorted_set_operations(inputs=16, size=100_000):
+    """Stream a k-way union and intersection and compare sharded set algebra."""
+    import random
+    import time
+
+    print(f"\n# BENCHMARK: SET OPERATIONS ({inputs} inputs of {size:,} sorted ids)")
+    sources = [sorted(random.sample(range(size * 4), size)) for _ in range(inputs)]
+    for name, operation in (("union_sorted", union_sorted), ("intersect_sorted", intersect_sorted)):
+        start = time.perf_counter()
+        produced = sum(1 for _ in operation(*(iter(source) for source in sources)))
+        print(f"{name:<18} {time.perf_counter() - start:7.3f}s  {produced:,} ids")
+
+    sets = [set(source) for source in sources]
+    start = time.perf_counter()
+    serial = set().union(*sets)
+    print(f"{'set.union':<18} {time.perf_counter() - start:7.3f}s  {len(serial):,} ids")
+    start = time.perf_counter()
+    parallel = parallel_set_operation("union", sets)
+    print(f"{'parallel union':<18} {time.perf_counter() - start:7.3f}s  {len(parallel):,} ids")
+
+def benchmark_bitset(size=1_000_000):
+    """Compare set algebra and memory of BitSet and Python sets over dense ids."""
+    import random
+    import time
+
+    ids_a = random.sample(range(size), size // 2)
+    ids_b = random.sample(range(size), size // 2)
+    print(f"\n# BENCHMARK: BITSET VS SET ({size // 2:,} ids per operand, domain {size:,})")
+    for name, factory in (("set", set), ("BitSet", BitSet)):
+        a, b = factory(ids_a), factory(ids_b)
+        start = time.perf_counter()
+        for _ in range(10):
+            a | b
+            a & b
+            a - b
+        elapsed = (time.perf_counter() - start) / 10
+        memory = a.nbytes() if name == "BitSet" else sys.getsizeof(a)
+        print(f"{name:<7} union+intersection+difference {elapsed * 1e3:8.2f}ms  "
+              f"memory {memory / 2**10:9.1f} KiB")
+
+def benchmark_disjoint_set(sizes=(10_000, 100_000, 1_000_000), operations=10_000_000, batch=1_000_000):
+    """Time a stream of random unions and finds over n ids to show near-linear scaling.
+
+    Ids are drawn in batches that are not timed, each used for as many unions
+    as finds, so the cost per operation can be compared across sizes.
+    """
+    import random
+    import time
+
+    print(f"\n# BENCHMARK: DISJOINT SET ({operations:,} operations per size)")
+    for size in sizes:
+        ds = DisjointSet(size)
+        rng = random.Random(size)
+        elapsed, done = 0.0, 0
+        while done < operations:
+            count = max(1, min(batch, operations - done) // 2)
+            ids = array("l", rng.choices(range(size), k=2 * count))
+            lefts, rights = ids[:count], ids[count:]
+            start = time.perf_counter()
+            for a, b in zip(lefts, rights):
+                ds.union(a, b)
+            for a in lefts:
+                ds.find(a)
+            elapsed += time.perf_counter() - start
+            done += 2 * count
+        print(f"n={size:<9} {done:,} operations in {elapsed:.3f}s "
+              f"({elapsed / done * 1e9:.0f} ns/op), {ds.components} components")
+
 # Execute Test Cases
 if __name__ == "__main__":
     test_union_sets()
+    test_sorted_set_operations()
+    test_disjoint_set()
+    test_bitset()
+    test_bloom_filter()
+    benchmark_disjoint_set(sizes=(10_000, 100_000))
+    benchmark_bitset()
+    benchmark_bloom_filter()
+    benchmark_sorted_set_operations()